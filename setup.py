@@ -2,14 +2,27 @@
 
 from setuptools import setup, find_packages
 
+# Optionally compile hot-path modules with Cython. The pure-Python sources
+# remain the fallback when Cython is unavailable at build time.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ["src/dahdi_phone/core/buffer_manager.py"],
+        compiler_directives={"language_level": 3},
+    )
+except ImportError:
+    ext_modules = []
+
 setup(
     name="dahdi_phone",
     version="1.0.0",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     install_requires=[
         "fastapi==0.68.0",
         "uvicorn==0.15.0",
+        "uvloop==0.16.0; sys_platform != 'win32'",
         "websockets==10.1",
         "pydantic==1.8.2",
         "PyYAML==6.0",
@@ -18,6 +31,7 @@ setup(
         "aiofiles==0.8.0",
         "typing-extensions==4.0.1",
         "structlog==21.5.0",
+        "orjson==3.8.3",
         "python-json-logger==2.0.7"
     ],
     python_requires=">=3.9",
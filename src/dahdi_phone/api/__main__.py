@@ -6,6 +6,7 @@ Handles startup configuration and server initialization.
 
 import sys
 import logging
+from dataclasses import replace
 from pathlib import Path
 from ..utils.logger import DAHDILogger, LoggerConfig
 from ..utils.config import Config, ConfigurationError
@@ -76,7 +77,7 @@ def main():
                 log_dir = "logs"
                 basic_logger.debug(f"Falling back to local log directory: {log_dir}")
                 os.makedirs(log_dir, mode=0o777, exist_ok=True)
-                config.logging.output = os.path.join(log_dir, "dahdi_phone.log")
+                config.logging = replace(config.logging, output=os.path.join(log_dir, "dahdi_phone.log"))
                 with open(config.logging.output, 'a'):
                     pass
                 os.chmod(config.logging.output, 0o666)
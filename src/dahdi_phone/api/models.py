@@ -21,6 +21,17 @@ class PhoneEventTypes(str, Enum):
     STATE = "state"         # Phone state change
     AUDIO = "audio"         # Audio-related event
     ERROR = "error"         # Error event
+    OFF_HOOK = "off_hook"   # Line went off-hook
+    ON_HOOK = "on_hook"     # Line went on-hook
+
+# Plain string values for hot event paths, avoiding Enum member lookups
+DTMF_EVENT = PhoneEventTypes.DTMF.value
+VOLTAGE_EVENT = PhoneEventTypes.VOLTAGE.value
+STATE_EVENT = PhoneEventTypes.STATE.value
+AUDIO_EVENT = PhoneEventTypes.AUDIO.value
+ERROR_EVENT = PhoneEventTypes.ERROR.value
+OFF_HOOK_EVENT = PhoneEventTypes.OFF_HOOK.value
+ON_HOOK_EVENT = PhoneEventTypes.ON_HOOK.value
 
 from pydantic import BaseModel, Field, validator
 import logging
@@ -6,7 +6,6 @@ handles WebSocket connections, and manages API routes.
 Provides centralized error handling and request logging.
 """
 
-import asyncio
 import logging
 import os
 import sys
@@ -15,7 +14,7 @@ from fastapi import FastAPI, Request, status, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-from typing import Any, Dict, Optional
+from typing import Optional
 
 from ..utils.config import Config, ConfigurationError
 from ..utils.logger import DAHDILogger, LoggerConfig, log_function_call
@@ -40,7 +39,7 @@ class DAHDIPhoneAPI:
     """
     def __init__(self):
         # Load configuration
-        self.config = Config()
+        self.config = Config.get()
         # Get the already configured logger instance
         self.logger = DAHDILogger()
         
@@ -115,9 +114,6 @@ class DAHDIPhoneAPI:
         self.dahdi_interface = None
         self.audio_processor = None
         
-        # Store active WebSocket connections
-        self.active_connections = set()
-        
         # Initialize API
         self._setup_middleware()
         self._setup_exception_handlers()
@@ -217,10 +213,6 @@ class DAHDIPhoneAPI:
                 global _dahdi_interface
                 _dahdi_interface = self.dahdi_interface
                 
-                logger.debug("Starting event processing loop")
-                asyncio.create_task(self._process_events())
-                logger.debug("Event processing loop started")
-                
                 logger.info("Server startup completed successfully")
                 logger.debug("All subsystems initialized and running")
                 
@@ -237,10 +229,6 @@ class DAHDIPhoneAPI:
             try:
                 logger.info("Shutting down server")
                 
-                # Close all WebSocket connections
-                for connection in self.active_connections:
-                    await connection.close()
-                
                 # Clean up hardware interface
                 if self.dahdi_interface:
                     await self.dahdi_interface.cleanup()
@@ -250,65 +238,6 @@ class DAHDIPhoneAPI:
             except Exception as e:
                 logger.error(f"Shutdown error: {str(e)}", exc_info=True)
 
-    async def _process_events(self) -> None:
-        """Process and broadcast hardware events to WebSocket clients"""
-        logger.debug("Event processing loop started")
-        event_count = 0
-        try:
-            while True:
-                event = await self.dahdi_interface.get_next_event()
-                if event:
-                    event_count += 1
-                    logger.debug(f"Received hardware event #{event_count}: {event}")
-                    
-                    # Convert hardware event to API event
-                    api_event = self._convert_event(event)
-                    logger.debug(f"Converted to API event: {api_event}")
-                    
-                    # Broadcast to all connected clients
-                    active_count = len(self.active_connections)
-                    logger.debug(f"Broadcasting event to {active_count} active connections")
-                    
-                    for connection in self.active_connections.copy():  # Use copy to avoid modification during iteration
-                        try:
-                            await connection.send_json(api_event)
-                            logger.debug(f"Successfully sent event to connection {id(connection)}")
-                        except Exception as e:
-                            logger.error(f"Failed to send event to connection {id(connection)}: {str(e)}")
-                            self.active_connections.remove(connection)
-                            logger.debug(f"Removed failed connection {id(connection)}, {len(self.active_connections)} remaining")
-                            
-                await asyncio.sleep(0.01)  # Small delay to prevent CPU spinning
-                
-        except Exception as e:
-            logger.error(f"Event processing error: {str(e)}", exc_info=True)
-            sys.exit(1)  # Exit with error code
-
-    def _convert_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert hardware events to API event format"""
-        try:
-            # Map hardware events to API events
-            event_type = event.get('type')
-            logger.debug(f"Converting event type: {event_type}")
-            
-            if event_type == 'hook_state':
-                converted_event = {
-                    'type': self.PhoneEventTypes.OFF_HOOK if event['state'] else self.PhoneEventTypes.ON_HOOK,
-                    'timestamp': event['timestamp']
-                }
-                logger.debug(f"Converted hook_state event: {converted_event}")
-                return converted_event
-                
-            # Add more event type conversions as needed
-            logger.debug(f"No conversion needed for event type: {event_type}")
-            return event
-            
-        except Exception as e:
-            error_event = {'type': self.PhoneEventTypes.ERROR, 'error': str(e)}
-            logger.error(f"Event conversion error: {str(e)}", exc_info=True)
-            logger.debug(f"Returning error event: {error_event}")
-            return error_event
-
 def run_server(config_path: Optional[str] = None):
     """
     Start the DAHDI Phone API server
@@ -331,7 +260,7 @@ def run_server(config_path: Optional[str] = None):
         
         # Get existing configuration
         server_logger.debug("Getting server configuration")
-        config = Config()  # This will get the singleton instance already configured
+        config = Config.get()  # The singleton instance, already configured
         
         # Log server startup details with full configuration info
         server_logger.info("Starting server with configuration:")
@@ -351,7 +280,9 @@ def run_server(config_path: Optional[str] = None):
                 host=config.server.host,
                 port=config.server.rest_port,
                 workers=config.server.workers,
-                log_level=config.logging.level.lower()
+                log_level=config.logging.level.lower(),
+                loop="auto",  # uvloop where installed (not on Windows), asyncio otherwise
+                ws="websockets"
             )
         except Exception as e:
             server_logger.error("Server runtime error", exc_info=True)
@@ -94,6 +94,11 @@ async def websocket_endpoint(
         }
         ```
     
+    Framing:
+    Each WebSocket message is a binary frame holding UTF-8 encoded JSON: an
+    array of one or more of the events above, in the order they occurred. Events that queue up while a message
+    is being sent are coalesced into the next message.
+    
     Connection Lifecycle:
     1. Connect to `/ws` endpoint
     2. Connection is accepted and events start streaming
@@ -106,13 +111,18 @@ async def websocket_endpoint(
     * Connection is auto-closed on fatal errors
     """
     await websocket.accept()
+    
+    # Subscribe to phone events with a private, bounded stream
+    stream = await dahdi_interface.open_event_stream()
     try:
-        # Subscribe to phone events
         while True:
-            # Send events as they occur
-            event = await dahdi_interface.get_next_event()
-            if event:
-                await websocket.send_json(event)
+            # Send everything queued since the last wakeup as one frame.
+            # Events arrive pre-serialized, so the array is built by joining bytes.
+            events = [await stream.get()]
+            events += stream.drain()
+            await websocket.send_bytes(b"[" + b",".join(events) + b"]")
     except WebSocketDisconnect:
-        # Clean up subscription
         pass
+    finally:
+        # Clean up subscription
+        await dahdi_interface.close_event_stream(stream)
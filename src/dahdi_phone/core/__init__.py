@@ -10,8 +10,9 @@ from .interfaces import (
     DAHDIStateError,
     DAHDITimeout,
     DAHDICommands,
+    DAHDIEvent,
 )
-from .dahdi_interface import DAHDIInterface
+from .dahdi_interface import DAHDIInterface, EventStream
 from .audio_processor import AudioProcessor
 
 __all__ = [
@@ -21,6 +22,8 @@ __all__ = [
     'DAHDIStateError',
     'DAHDITimeout',
     'DAHDICommands',
+    'DAHDIEvent',
     'DAHDIInterface',
+    'EventStream',
     'AudioProcessor',
 ]
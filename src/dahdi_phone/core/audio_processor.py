@@ -8,7 +8,7 @@ Includes DTMF tone detection and event notification capabilities.
 import logging
 import numpy as np
 import asyncio
-from typing import Optional, Tuple, Set, Callable
+from typing import Optional, Tuple, Set, Callable, Union
 from dataclasses import dataclass
 from .buffer_manager import CircularBuffer, BufferError
 from .dtmf_detector import DTMFDetector, DTMFConfig
@@ -49,6 +49,8 @@ class AudioProcessor:
     
     def _setup_logging(self):
         """Configure detailed logging for audio processing operations"""
+        # Checked once so the per-frame paths skip debug formatting entirely
+        self._dbg = logger.isEnabledFor(logging.DEBUG)
         self.debug_stats = {
             'frames_processed': 0,
             'buffer_overruns': 0,
@@ -96,13 +98,14 @@ class AudioProcessor:
             await asyncio.gather(*notification_tasks, return_exceptions=True)
             logger.debug(f"Notified {len(notification_tasks)} DTMF subscribers of event: {event}")
 
-    async def process_frame(self, raw_data: bytes) -> Tuple[np.ndarray, dict]:
+    async def process_frame(self, raw_data: Union[bytes, memoryview]) -> Tuple[np.ndarray, dict]:
         """
-        Process a single frame of audio data with comprehensive error handling.
-        Includes DTMF detection and event notification.
+        Process a frame (or a chunk of consecutive frames) of audio data with
+        comprehensive error handling. Includes DTMF detection and event notification.
         
         Args:
-            raw_data: Raw audio bytes from DAHDI
+            raw_data: Raw audio bytes from DAHDI, or a view of them; the data
+                is only read during the call and not retained
             
         Returns:
             Tuple of processed audio array and frame statistics
@@ -111,7 +114,8 @@ class AudioProcessor:
             AudioProcessingError: If processing fails
         """
         try:
-            logger.debug(f"Processing frame of size {len(raw_data)} bytes")
+            if self._dbg:
+                logger.debug("Processing frame of size %d bytes", len(raw_data))
             
             # Convert to numpy array for processing
             audio_array = np.frombuffer(raw_data, dtype=np.int16)
@@ -119,12 +123,17 @@ class AudioProcessor:
             # Apply audio processing pipeline
             processed = await self._apply_processing(audio_array)
             
-            # Perform DTMF detection
-            dtmf_event = await self.dtmf_detector.process_frame(processed)
-            if dtmf_event:
-                self.debug_stats['dtmf_events'] += 1
-                logger.info(f"DTMF detected: {dtmf_event.digit}")
-                await self._notify_dtmf_subscribers(dtmf_event)
+            # Perform DTMF detection one detector window at a time, so multi-frame
+            # chunks keep the same detection resolution as single frames
+            dtmf_event = None
+            window = self.dtmf_detector.config.frame_size
+            for start in range(0, len(processed), window):
+                event = await self.dtmf_detector.process_frame(processed[start:start + window])
+                if event:
+                    dtmf_event = event
+                    self.debug_stats['dtmf_events'] += 1
+                    logger.info(f"DTMF detected: {event.digit}")
+                    await self._notify_dtmf_subscribers(event)
             
             # Update statistics
             self.debug_stats['frames_processed'] += 1
@@ -137,7 +146,8 @@ class AudioProcessor:
                 'dtmf_detected': dtmf_event.digit if dtmf_event else None
             }
             
-            logger.debug(f"Frame {stats['frame_number']} processed: {stats}")
+            if self._dbg:
+                logger.debug("Frame %d processed: %s", stats['frame_number'], stats)
             return processed, stats
             
         except Exception as e:
@@ -155,17 +165,21 @@ class AudioProcessor:
         Returns:
             Processed audio array
         """
-        logger.debug("Starting audio processing pipeline")
+        dbg = self._dbg
+        if dbg:
+            logger.debug("Starting audio processing pipeline")
         
         try:
             # DC offset removal
             audio_array = audio_array - np.mean(audio_array)
-            logger.debug("DC offset removed")
+            if dbg:
+                logger.debug("DC offset removed")
 
             # Normalize audio
             if np.max(np.abs(audio_array)) > 0:
                 audio_array = audio_array / np.max(np.abs(audio_array)) * 32767
-                logger.debug("Audio normalized")
+                if dbg:
+                    logger.debug("Audio normalized")
             
             # Apply any additional processing here
             
@@ -0,0 +1,15 @@
+# src/dahdi_phone/core/buffer_manager.pxd
+# Cython declarations for compiling buffer_manager.py as an extension module.
+# The .py file stays importable on its own when the extension is not built.
+
+cdef class CircularBuffer:
+    cdef object _mv
+    cdef object _unmap
+    cdef Py_ssize_t _span
+    cdef Py_ssize_t _mask
+    cdef Py_ssize_t _head
+    cdef Py_ssize_t _tail
+    cdef bint _dbg
+    cdef public Py_ssize_t size
+    cdef public bint mirrored
+    cdef public dict stats
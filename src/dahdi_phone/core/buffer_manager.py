@@ -3,26 +3,112 @@
 Circular buffer implementation for audio data management with extensive logging.
 """
 
+import os
+import mmap
+import ctypes
+import weakref
 import logging
-import threading
-from typing import Optional
-from collections import deque
+from typing import Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Linux mmap constants not exported by the mmap module
+_PROT_NONE = 0x0
+_MAP_FIXED = 0x10
+
+def _mirrored_mapping(size: int) -> Optional[Tuple[memoryview, weakref.finalize]]:
+    """
+    Map the same memfd-backed pages twice back to back, so that any span of up
+    to size bytes starting inside the first copy is contiguous in memory.
+    
+    Args:
+        size: Ring size in bytes, must be a multiple of mmap.PAGESIZE
+        
+    Returns:
+        Tuple of (memoryview over 2*size bytes, unmap finalizer) or None if
+        the platform does not support the double mapping
+    """
+    fd = -1
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.mmap.restype = ctypes.c_void_p
+        libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int,
+                              ctypes.c_int, ctypes.c_int, ctypes.c_long]
+        libc.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        map_failed = ctypes.c_void_p(-1).value
+        
+        fd = os.memfd_create("dahdi_ring")
+        os.ftruncate(fd, size)
+        
+        # Reserve a contiguous 2*size region, then overlay both halves on the memfd
+        base = libc.mmap(None, 2 * size, _PROT_NONE,
+                         mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS, -1, 0)
+        if base in (None, map_failed):
+            return None
+        rw = mmap.PROT_READ | mmap.PROT_WRITE
+        for addr in (base, base + size):
+            if libc.mmap(addr, size, rw, mmap.MAP_SHARED | _MAP_FIXED, fd, 0) != addr:
+                libc.munmap(base, 2 * size)
+                return None
+        
+        # Tie the unmap to the exporter rather than to any one view: every
+        # view and slice keeps it alive, so the pages outlive the last of them
+        exporter = (ctypes.c_ubyte * (2 * size)).from_address(base)
+        unmap = weakref.finalize(exporter, libc.munmap, base, 2 * size)
+        return memoryview(exporter).cast('B'), unmap
+        
+    except (AttributeError, OSError):
+        return None
+    finally:
+        # The mappings keep the pages alive once established
+        if fd >= 0:
+            os.close(fd)
+
 class CircularBuffer:
     """
-    Thread-safe circular buffer implementation with detailed logging.
+    Lock-free single-producer/single-consumer circular buffer with detailed logging.
+
+    SPSC contract: exactly one thread may call write() and exactly one thread may
+    call read(). The producer only advances _tail and the consumer only advances
+    _head; both are free-running counters, so the fill level is simply
+    _tail - _head and no lock is required. Capacity is rounded up to a power of
+    two so buffer offsets can be taken with a mask instead of a modulo.
+
+    Where supported, the storage is mapped twice back to back so every copy is
+    a single contiguous slice; otherwise a plain bytearray with split copies on
+    wrap-around is used.
+
+    Besides the copying write()/read(), the producer can fill the ring in place
+    with acquire()/commit() and the consumer can drain it in place with
+    peek()/consume(). Views returned by acquire() and peek() are only valid
+    until the matching commit()/consume(); close() refuses to unmap the ring
+    while any of them are still alive.
     """
     def __init__(self, size: int):
-        self.buffer = deque(maxlen=size)
-        self.lock = threading.Lock()
+        size = 1 << max(size - 1, 0).bit_length()
+        
+        mirrored = _mirrored_mapping(max(size, mmap.PAGESIZE))
+        if mirrored is not None:
+            self._mv, self._unmap = mirrored
+            size = len(self._mv) // 2
+            self._span = 2 * size  # Copies never need to wrap
+        else:
+            self._mv = memoryview(bytearray(size))
+            self._unmap = None
+            self._span = size
+        self.mirrored = mirrored is not None
+        
+        self._mask = size - 1
+        self._head = 0  # Only advanced by the consumer
+        self._tail = 0  # Only advanced by the producer
         self.size = size
         self._setup_logging()
-        logger.info(f"Initialized CircularBuffer with size {size}")
+        logger.info(f"Initialized CircularBuffer with size {size} (mirrored={self.mirrored})")
     
     def _setup_logging(self):
         """Configure buffer statistics and logging"""
+        # Checked once so the per-frame paths skip debug formatting entirely
+        self._dbg = logger.isEnabledFor(logging.DEBUG)
         self.stats = {
             'total_writes': 0,
             'total_reads': 0,
@@ -30,35 +116,51 @@ class CircularBuffer:
             'underruns': 0
         }
     
-    def write(self, data: bytes) -> bool:
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> bool:
         """
         Write data to buffer with overflow protection and logging.
+        Must only be called from the producer side.
         
         Args:
-            data: Bytes to write to buffer
+            data: Bytes-like data to write to buffer
             
         Returns:
             Success status
         """
-        with self.lock:
-            try:
-                if len(self.buffer) + len(data) > self.size:
-                    self.stats['overruns'] += 1
-                    logger.warning(f"Buffer overrun detected. Utilization: {self.utilization:.2f}")
-                    return False
-                
-                self.buffer.extend(data)
-                self.stats['total_writes'] += 1
-                logger.debug(f"Written {len(data)} bytes. Buffer utilization: {self.utilization:.2f}")
-                return True
-                
-            except Exception as e:
-                logger.error(f"Buffer write error: {str(e)}", exc_info=True)
-                raise BufferError(f"Write operation failed: {str(e)}") from e
+        try:
+            length = len(data)
+            tail = self._tail
+            used = tail - self._head
+            if used + length > self.size:
+                self.stats['overruns'] += 1
+                logger.warning(f"Buffer overrun detected. Utilization: {used / self.size:.2f}")
+                return False
+            
+            # Copy in at most two slices: up to the end of the buffer, then wrap.
+            # With a mirrored mapping the first slice always covers everything.
+            offset = tail & self._mask
+            first = min(length, self._span - offset)
+            self._mv[offset:offset + first] = data[:first]
+            if first < length:
+                self._mv[:length - first] = data[first:]
+            
+            # Publish only after the payload is in place
+            self._tail = tail + length
+            
+            self.stats['total_writes'] += 1
+            if self._dbg:
+                logger.debug("Written %d bytes. Buffer utilization: %.2f",
+                             length, (used + length) / self.size)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Buffer write error: {str(e)}", exc_info=True)
+            raise BufferError(f"Write operation failed: {str(e)}") from e
     
     def read(self, size: int) -> Optional[bytes]:
         """
         Read data from buffer with detailed logging.
+        Must only be called from the consumer side.
         
         Args:
             size: Number of bytes to read
@@ -66,38 +168,132 @@ class CircularBuffer:
         Returns:
             Read bytes or None if not enough data
         """
-        with self.lock:
-            try:
-                if len(self.buffer) < size:
-                    self.stats['underruns'] += 1
-                    logger.warning(f"Buffer underrun. Requested: {size}, Available: {len(self.buffer)}")
-                    return None
-                
-                data = bytes([self.buffer.popleft() for _ in range(size)])
-                self.stats['total_reads'] += 1
-                logger.debug(f"Read {size} bytes. Buffer utilization: {self.utilization:.2f}")
-                return data
-                
-            except Exception as e:
-                logger.error(f"Buffer read error: {str(e)}", exc_info=True)
-                raise BufferError(f"Read operation failed: {str(e)}") from e
+        try:
+            head = self._head
+            available = self._tail - head
+            if available < size:
+                self.stats['underruns'] += 1
+                logger.warning(f"Buffer underrun. Requested: {size}, Available: {available}")
+                return None
+            
+            # Copy out at most two slices, mirroring write()
+            offset = head & self._mask
+            first = min(size, self._span - offset)
+            if first == size:
+                data = bytes(self._mv[offset:offset + size])
+            else:
+                data = bytes(self._mv[offset:]) + bytes(self._mv[:size - first])
+            
+            # Release the space only after the payload has been copied out
+            self._head = head + size
+            
+            self.stats['total_reads'] += 1
+            if self._dbg:
+                logger.debug("Read %d bytes. Buffer utilization: %.2f",
+                             size, (available - size) / self.size)
+            return data
+            
+        except Exception as e:
+            logger.error(f"Buffer read error: {str(e)}", exc_info=True)
+            raise BufferError(f"Read operation failed: {str(e)}") from e
+    
+    def acquire(self, size: int) -> Optional[memoryview]:
+        """
+        Reserve space for size bytes to be filled in place by the producer.
+        Nothing becomes readable until commit() is called.
+        
+        Args:
+            size: Number of bytes to reserve
+            
+        Returns:
+            Writable contiguous view of size bytes, or None if there is not
+            enough free space or the slot would wrap in a non-mirrored buffer
+        """
+        tail = self._tail
+        if tail - self._head + size > self.size:
+            return None
+        offset = tail & self._mask
+        if offset + size > self._span:
+            return None
+        return self._mv[offset:offset + size]
+    
+    def commit(self, size: int) -> None:
+        """
+        Publish size bytes previously filled through acquire().
+        Must only be called from the producer side.
+        
+        Args:
+            size: Number of bytes written into the acquired view
+        """
+        self._tail += size
+        self.stats['total_writes'] += 1
+    
+    def peek(self, size: int) -> memoryview:
+        """
+        View readable data in place without consuming it.
+        Must only be called from the consumer side.
+        
+        Args:
+            size: Maximum number of bytes to view
+            
+        Returns:
+            Read-only contiguous view of up to size bytes; shorter than requested
+            if less is buffered or, in a non-mirrored buffer, the data wraps
+        """
+        head = self._head
+        offset = head & self._mask
+        size = min(size, self._tail - head, self._span - offset)
+        return self._mv[offset:offset + size].toreadonly()
+    
+    def consume(self, size: int) -> None:
+        """
+        Release size bytes previously viewed through peek().
+        Must only be called from the consumer side.
+        
+        Args:
+            size: Number of bytes to release
+        """
+        self._head += size
+        self.stats['total_reads'] += 1
+    
+    def __len__(self) -> int:
+        """Number of bytes currently available to read"""
+        head = self._head
+        return self._tail - head
     
     @property
     def utilization(self) -> float:
-        """Calculate current buffer utilization with thread safety"""
-        with self.lock:
-            return len(self.buffer) / self.size
+        """Calculate current buffer utilization from a head/tail snapshot"""
+        head = self._head
+        return (self._tail - head) / self.size
 
     def get_stats(self) -> dict:
         """Return detailed buffer statistics"""
-        with self.lock:
-            return {
-                **self.stats,
-                'current_utilization': self.utilization,
-                'size': self.size,
-                'available': self.size - len(self.buffer)
-            }
+        head = self._head
+        used = self._tail - head
+        return {
+            **self.stats,
+            'current_utilization': used / self.size,
+            'size': self.size,
+            'available': self.size - used,
+            'mirrored': self.mirrored
+        }
+
+    def close(self) -> None:
+        """
+        Release the mirrored mapping, if any.
+        
+        Raises:
+            BufferError: If views from acquire()/peek() are still alive; the
+                mapping is then only unmapped once the last of them is dropped
+        """
+        unmap, self._unmap = self._unmap, None
+        if unmap is None:
+            return
+        self._mv.release()
+        if unmap.alive:
+            raise BufferError("Cannot unmap buffer while acquired or peeked views are exported")
 
 class BufferError(Exception):
     """Custom exception for buffer operations"""
-    pass
\ No newline at end of file
+    pass
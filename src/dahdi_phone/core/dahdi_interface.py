@@ -10,22 +10,222 @@ and WebSocket event forwarding.
 import os
 import fcntl
 import asyncio
+import logging
 import struct
-from typing import Optional, Dict, Any, Set, Callable
-from datetime import datetime
+import time
+import orjson
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Callable, Tuple, Union
+from datetime import datetime, timezone
 import structlog
 from ..utils.logger import DAHDILogger, log_function_call
-from ..api.models import DTMFEvent, PhoneEventTypes
+from ..api.models import DTMFEvent, DTMF_EVENT, VOLTAGE_EVENT, OFF_HOOK_EVENT, ON_HOOK_EVENT
 from ..core.audio_processor import AudioProcessor, AudioConfig
+from ..core.buffer_manager import CircularBuffer, BufferError
+from ..hardware import fxs
 from .interfaces import (
     DAHDIHardwareInterface,
     DAHDIIOError,
     DAHDIStateError,
     DAHDITimeout,
     DAHDICommands,
+    DAHDIEvent,
     DAHDIState,
 )
 
+# Precompiled ioctl argument/result layouts
+_U32 = struct.Struct('I')
+_I32 = struct.Struct('i')
+_F32 = struct.Struct('f')
+_ZERO_U32 = _U32.pack(0)
+_ZERO_I32 = _I32.pack(0)
+
+# Event codes are looked up as plain ints, skipping IntEnum comparisons
+_ALARM_EVENTS = frozenset((int(DAHDIEvent.ALARM), int(DAHDIEvent.NOALARM)))
+# Line state entered on each hook event code; other codes do not change it
+_HOOK_EVENT_STATES = {
+    int(DAHDIEvent.RINGOFFHOOK): DAHDIState.OFFHOOK,
+    int(DAHDIEvent.ONHOOK): DAHDIState.ONHOOK,
+}
+# Event type published for each hook state entered
+_HOOK_STATE_EVENTS = {
+    DAHDIState.OFFHOOK: OFF_HOOK_EVENT,
+    DAHDIState.ONHOOK: ON_HOOK_EVENT,
+}
+
+# Internal event queue depth before the oldest events are dropped
+EVENT_QUEUE_SIZE = 512
+
+# Per-subscriber event stream depth before the oldest events are dropped
+EVENT_STREAM_SIZE = 256
+
+# Coalescing window and size limit for subscribers that opt in to batched delivery
+NOTIFY_BATCH_WINDOW = 0.005  # seconds
+NOTIFY_BATCH_MAX = 32
+
+# Minimum interval between event queue overrun warnings
+OVERRUN_WARNING_INTERVAL = 10.0  # seconds
+
+# Receive ring capacity, in multiples of the device read size
+RX_RING_FRAMES = 16
+
+# Maximum device reads drained per readiness callback
+RX_READ_BATCH = 32
+
+# Transmit ring capacity, in multiples of the device read size
+TX_RING_FRAMES = 16
+
+# errno DAHDI sets on read() when a channel event is waiting for DAHDI_GETEVENT
+DAHDI_ELAST = 500
+
+# Hook and ring changes are event-driven; voltage is only a periodic health check,
+# re-read early when a DAHDI event indicates the line may have changed. After a
+# change the line is re-read at VOLTAGE_SETTLE_INTERVAL, doubling with each
+# stable reading until the poll interval is reached again
+VOLTAGE_POLL_INTERVAL = 10.0  # seconds
+VOLTAGE_SETTLE_INTERVAL = 0.05  # seconds
+VOLTAGE_CHANGE_THRESHOLD = 0.5  # volts
+
+# Voltage monitor retry policy: exponential backoff capped at the maximum,
+# giving up after this many consecutive failures
+VOLTAGE_RETRY_MAX_DELAY = 60.0  # seconds
+VOLTAGE_MAX_FAILURES = 10
+
+@dataclass
+class DTMFPayload:
+    """Event queue payload for a detected DTMF digit"""
+    __slots__ = ('type', 'digit', 'duration', 'signal_level', 'timestamp')
+    type: str
+    digit: str
+    duration: int
+    signal_level: float
+    timestamp: datetime
+
+@dataclass
+class VoltagePayload:
+    """Event queue payload for a line voltage change"""
+    __slots__ = ('type', 'value', 'timestamp')
+    type: str
+    value: float
+    timestamp: datetime
+
+@dataclass
+class HookStatePayload:
+    """Event queue payload for a hook state change (off_hook or on_hook)"""
+    __slots__ = ('type', 'timestamp')
+    type: str
+    timestamp: datetime
+
+# Fixed-shape event payloads; orjson serializes these dataclasses natively,
+# including the ISO 8601 formatting of their timestamps
+EventPayload = Union[DTMFPayload, VoltagePayload, HookStatePayload]
+
+class EventStream:
+    """
+    Bounded single-producer/single-consumer event stream.
+    The broadcaster appends and the owning client pops; a full stream drops its
+    oldest item. Items sit in a deque and a consumer waits on one asyncio.Event,
+    so neither side allocates futures or takes locks per event.
+    """
+    __slots__ = ('_items', '_ready')
+
+    def __init__(self, maxsize: int = EVENT_STREAM_SIZE):
+        self._items: deque = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+
+    def put_nowait(self, item: Any) -> bool:
+        """
+        Append an item, evicting the oldest one if the stream is full.
+        
+        Returns:
+            True if an older item had to be dropped
+        """
+        items = self._items
+        dropped = len(items) == items.maxlen
+        items.append(item)
+        self._ready.set()
+        return dropped
+
+    async def get(self) -> Any:
+        """Remove and return the oldest item, waiting until one is available"""
+        items = self._items
+        while not items:
+            self._ready.clear()
+            await self._ready.wait()
+        return items.popleft()
+
+    def get_nowait(self) -> Any:
+        """Remove and return the oldest item, raising asyncio.QueueEmpty if there is none"""
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise asyncio.QueueEmpty from None
+
+    def drain(self, limit: Optional[int] = None) -> List[Any]:
+        """Remove and return all available items, oldest first, up to limit"""
+        items = self._items
+        count = len(items) if limit is None else min(limit, len(items))
+        popleft = items.popleft
+        return [popleft() for _ in range(count)]
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    __len__ = qsize
+
+def _json_array(payloads: List[bytes]) -> bytes:
+    """Join pre-serialized JSON payloads into one JSON array"""
+    return b"[" + b",".join(payloads) + b"]"
+
+class _CoalescingCallback:
+    """
+    Delivery wrapper for a batched plain callback.
+    Payloads are collected for NOTIFY_BATCH_WINDOW after the first one arrives
+    (or until NOTIFY_BATCH_MAX are pending) and handed over as one JSON array.
+    """
+    __slots__ = ('callback', 'log', '_pending', '_flush_handle')
+
+    def __init__(self, callback: Callable[[bytes], None], log: Any):
+        self.callback = callback
+        self.log = log
+        self._pending: List[bytes] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def __call__(self, payload: bytes) -> None:
+        self._pending.append(payload)
+        if len(self._pending) >= NOTIFY_BATCH_MAX:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                NOTIFY_BATCH_WINDOW, self.flush)
+
+    def flush(self) -> None:
+        """Deliver all pending payloads now"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        try:
+            self.callback(_json_array(batch))
+        except Exception as e:
+            self.log.warning("websocket_subscriber_failed",
+                            message="WebSocket subscriber raised",
+                            error=str(e))
+
+    def cancel(self) -> None:
+        """Discard pending payloads and stop the flush timer"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending.clear()
+
 class DAHDIInterface(DAHDIHardwareInterface):
     """
     Primary interface to DAHDI hardware.
@@ -36,8 +236,37 @@ class DAHDIInterface(DAHDIHardwareInterface):
         self.device_path = device_path
         self.device_fd = None
         self.state = DAHDIState.ONHOOK
-        self.event_queue = asyncio.Queue()
+        # Internal event queue: producers append and set _event_ready, the
+        # broadcaster drains it; maxlen makes the deque drop the oldest event
+        self._events: deque = deque(maxlen=EVENT_QUEUE_SIZE)
+        self._event_ready = asyncio.Event()
+        self._last_overrun_warning = 0.0
         self.voltage_monitor_task = None
+        self.broadcast_task = None
+        self._ioctl_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Receive path: the loop's reader callback fills the ring as the device
+        # becomes readable, and read_audio() waits on _frame_ready instead of polling
+        self._read_size = buffer_size
+        self._rx_ring = CircularBuffer(size=buffer_size * RX_RING_FRAMES)
+        self._frame_ready = asyncio.Event()
+        self._reader_registered = False
+        
+        # Transmit path: producers fill the ring (in place via acquire_tx_slot or
+        # with one copy via write_audio) and the loop's writer callback hands
+        # ring memory straight to os.write() while the device accepts data
+        self._tx_ring = CircularBuffer(size=buffer_size * TX_RING_FRAMES)
+        self._tx_space = asyncio.Event()
+        self._writer_registered = False
+        
+        # Last voltage reported as an event, for change detection
+        self._last_voltage: Optional[float] = None
+        
+        # Set by the DAHDI event handler to cut the voltage poll interval short
+        self._voltage_check = asyncio.Event()
+        
+        # Called inline with each new voltage, after the voltage event is queued
+        self._voltage_listeners: List[Callable[[float], None]] = []
         
         # Initialize audio processor
         audio_config = AudioConfig(
@@ -49,15 +278,29 @@ class DAHDIInterface(DAHDIHardwareInterface):
         self.audio_processor = AudioProcessor(audio_config)
         
         # Initialize FXS port
-        fxs_config = FXSConfig(
+        fxs_config = fxs.FXSConfig(
             channel=1,  # Default channel
             idle_voltage=48.0,
             ring_voltage=90.0
         )
         self.fxs_port = None  # Will be initialized in initialize()
         
-        # WebSocket event subscribers
-        self._websocket_subscribers: Set[Callable[[Dict[str, Any]], None]] = set()
+        # Pending ring stop timer while a timed ring is active
+        self._ring_handle: Optional[asyncio.TimerHandle] = None
+        
+        # WebSocket event subscribers, mapped to the callable that delivers to them
+        # (the callback itself, or its coalescing wrapper when batched)
+        # Registries are insertion-ordered dicts, so (un)subscribe is O(1);
+        # notification iterates an immutable snapshot rebuilt at those points
+        self._websocket_subscribers: Dict[Callable[[bytes], None], Callable[[bytes], None]] = {}
+        self._subscriber_snapshot: Tuple[Callable[[bytes], None], ...] = ()
+        
+        # Per-client bounded event streams fed by the broadcaster task
+        self._event_streams: Dict[EventStream, None] = {}
+        self._stream_snapshot: Tuple[EventStream, ...] = ()
+        
+        # Async subscribers are driven from their own stream by one pump task each
+        self._subscriber_pumps: Dict[Callable, Tuple[EventStream, asyncio.Task]] = {}
         
         # Initialize structured logger with context
         self.log = DAHDILogger().get_logger(__name__).bind(
@@ -71,6 +314,8 @@ class DAHDIInterface(DAHDIHardwareInterface):
 
     def _setup_logging(self):
         """Configure interface-specific logging"""
+        # Checked once so per-frame audio paths skip debug event construction
+        self._debug_enabled = self.log.isEnabledFor(logging.DEBUG)
         self.debug_stats = {
             'ioctl_calls': 0,
             'bytes_read': 0,
@@ -78,11 +323,14 @@ class DAHDIInterface(DAHDIHardwareInterface):
             'errors': 0,
             'state_changes': 0,
             'dtmf_events': 0,
-            'websocket_notifications': 0
+            'websocket_notifications': 0,
+            'events_dropped': 0,
+            'event_queue_overruns': 0
         }
-        self.log.debug("debug_stats_initialized", 
-                      message="DAHDI interface debug statistics initialized",
-                      initial_stats=self.debug_stats)
+        if self._debug_enabled:
+            self.log.debug("debug_stats_initialized", 
+                          message="DAHDI interface debug statistics initialized",
+                          initial_stats=self.debug_stats)
 
     @log_function_call(level="DEBUG")
     async def initialize(self) -> None:
@@ -110,16 +358,25 @@ class DAHDIInterface(DAHDIHardwareInterface):
             flags = fcntl.fcntl(self.device_fd, fcntl.F_GETFL)
             fcntl.fcntl(self.device_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
             
+            # Single worker keeps ioctls ordered while taking them off the event loop
+            self._ioctl_executor = ThreadPoolExecutor(max_workers=1,
+                                                      thread_name_prefix="dahdi-ioctl")
+            
+            # Read audio only when the device signals readiness
+            asyncio.get_running_loop().add_reader(self.device_fd, self._on_dahdi_readable)
+            self._reader_registered = True
+            
             # Initialize FXS port
-            self.fxs_port = FXSPort(
-                config=FXSConfig(channel=1),
+            self.fxs_port = fxs.FXSPort(
+                config=fxs.FXSConfig(channel=1),
                 dahdi=self,  # Pass self for low-level operations
                 audio=self.audio_processor
             )
             await self.fxs_port.initialize()
             
-            # Start monitoring tasks
+            # Start monitoring and event fan-out tasks
             self.voltage_monitor_task = asyncio.create_task(self._monitor_voltage())
+            self.broadcast_task = asyncio.create_task(self._broadcast_events())
             
             self.log.info("init_complete", 
                          message="DAHDI interface initialized successfully",
@@ -133,55 +390,172 @@ class DAHDIInterface(DAHDIHardwareInterface):
             await self.cleanup()
             raise DAHDIIOError(f"Device initialization failed: {str(e)}") from e
 
-    @log_function_call(level="DEBUG")
-    async def subscribe_websocket(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+    async def subscribe_websocket(self, callback: Callable[[bytes], None],
+                                  batched: bool = False) -> None:
         """
         Subscribe to WebSocket events.
+        Plain callbacks are invoked inline by the broadcaster and must not block.
+        Coroutine functions are fed from a bounded event stream by a dedicated task.
         
         Args:
-            callback: Function to call for WebSocket events
+            callback: Function to call with each event, pre-serialized as JSON bytes
+            batched: Coalesce events arriving within NOTIFY_BATCH_WINDOW and pass
+                them to callback as a single JSON array instead
         """
-        self._websocket_subscribers.add(callback)
+        if asyncio.iscoroutinefunction(callback):
+            stream = await self.open_event_stream()
+            task = asyncio.create_task(self._pump_event_stream(stream, callback, batched))
+            self._subscriber_pumps[callback] = (stream, task)
+        else:
+            if callback not in self._websocket_subscribers:
+                deliver = _CoalescingCallback(callback, self.log) if batched else callback
+                self._websocket_subscribers[callback] = deliver
+                self._subscriber_snapshot = tuple(self._websocket_subscribers.values())
         self.log.debug("websocket_subscriber_added",
                       message="Added WebSocket subscriber",
                       total_subscribers=len(self._websocket_subscribers))
 
-    @log_function_call(level="DEBUG")
-    async def unsubscribe_websocket(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+    async def unsubscribe_websocket(self, callback: Callable[[bytes], None]) -> None:
         """
         Unsubscribe from WebSocket events.
         
         Args:
             callback: Previously registered callback function
         """
-        self._websocket_subscribers.discard(callback)
+        pump = self._subscriber_pumps.pop(callback, None)
+        if pump:
+            stream, task = pump
+            task.cancel()
+            await self.close_event_stream(stream)
+        deliver = self._websocket_subscribers.pop(callback, None)
+        if deliver is not None:
+            if isinstance(deliver, _CoalescingCallback):
+                deliver.cancel()
+            self._subscriber_snapshot = tuple(self._websocket_subscribers.values())
         self.log.debug("websocket_subscriber_removed",
                       message="Removed WebSocket subscriber",
                       total_subscribers=len(self._websocket_subscribers))
 
-    async def _notify_websocket_subscribers(self, event: Dict[str, Any]) -> None:
+    @log_function_call(level="DEBUG")
+    async def open_event_stream(self, maxsize: int = EVENT_STREAM_SIZE) -> EventStream:
+        """
+        Register a bounded per-client event stream.
+        When the client falls behind, the oldest undelivered events are dropped.
+        
+        Args:
+            maxsize: Maximum number of undelivered events to keep
+            
+        Returns:
+            Queue that receives every event published after registration,
+            pre-serialized as JSON bytes
+        """
+        stream = EventStream(maxsize)
+        self._event_streams[stream] = None
+        self._stream_snapshot = tuple(self._event_streams)
+        self.log.debug("event_stream_opened",
+                      message="Opened event stream",
+                      total_streams=len(self._event_streams))
+        return stream
+
+    @log_function_call(level="DEBUG")
+    async def close_event_stream(self, stream: EventStream) -> None:
         """
-        Notify all WebSocket subscribers of an event.
+        Unregister a per-client event stream.
+        
+        Args:
+            stream: Queue previously returned by open_event_stream
+        """
+        if stream in self._event_streams:
+            del self._event_streams[stream]
+            self._stream_snapshot = tuple(self._event_streams)
+        self.log.debug("event_stream_closed",
+                      message="Closed event stream",
+                      total_streams=len(self._event_streams))
+
+    async def _pump_event_stream(self, stream: EventStream,
+                                 callback: Callable[[bytes], Any],
+                                 batched: bool = False) -> None:
+        """
+        Deliver events from a stream to an async subscriber, one at a time, or
+        when batched as one JSON array per NOTIFY_BATCH_WINDOW
+        """
+        while True:
+            payload = await stream.get()
+            if batched:
+                await asyncio.sleep(NOTIFY_BATCH_WINDOW)
+                batch = [payload]
+                batch += stream.drain(NOTIFY_BATCH_MAX - 1)
+                payload = _json_array(batch)
+            try:
+                await callback(payload)
+            except Exception as e:
+                self.log.warning("websocket_subscriber_failed",
+                                message="WebSocket subscriber raised",
+                                error=str(e))
+
+    def _publish_event(self, event: EventPayload) -> None:
+        """
+        Queue an event for the broadcaster without blocking the producer.
+        If the queue is full the oldest event is dropped; overruns are counted
+        and reported at most once per OVERRUN_WARNING_INTERVAL.
+        
+        Args:
+            event: Event data to publish
+        """
+        events = self._events
+        overrun = len(events) == events.maxlen
+        events.append(event)
+        self._event_ready.set()
+        if not overrun:
+            return
+        
+        self.debug_stats['event_queue_overruns'] += 1
+        now = time.monotonic()
+        if now - self._last_overrun_warning >= OVERRUN_WARNING_INTERVAL:
+            self._last_overrun_warning = now
+            self.log.warning("event_queue_overrun",
+                            message="Event queue full, dropping oldest events",
+                            total_overruns=self.debug_stats['event_queue_overruns'])
+
+    async def _broadcast_events(self) -> None:
+        """Single consumer of the event queue, fanning events out to all subscribers"""
+        while True:
+            event = await self.get_next_event()
+            if event is not None:
+                await self._notify_websocket_subscribers(event)
+
+    async def _notify_websocket_subscribers(self, event: EventPayload) -> None:
+        """
+        Notify all event streams and WebSocket subscribers of an event.
+        The event is serialized once and the same bytes are shared by all.
         
         Args:
             event: Event data to broadcast
         """
-        notification_tasks = []
+        payload = orjson.dumps(event, default=str, option=orjson.OPT_UTC_Z)
+        
+        for stream in self._stream_snapshot:
+            if stream.put_nowait(payload):
+                self.debug_stats['events_dropped'] += 1
         
-        for callback in self._websocket_subscribers:
-            task = asyncio.create_task(callback(event))
-            notification_tasks.append(task)
+        subscribers = self._subscriber_snapshot
+        for callback in subscribers:
+            try:
+                callback(payload)
+            except Exception as e:
+                self.log.warning("websocket_subscriber_failed",
+                                message="WebSocket subscriber raised",
+                                error=str(e))
             
-        if notification_tasks:
-            self.debug_stats['websocket_notifications'] += len(notification_tasks)
-            await asyncio.gather(*notification_tasks, return_exceptions=True)
+        if subscribers:
+            self.debug_stats['websocket_notifications'] += len(subscribers)
             
-            self.log.debug("websocket_notifications_sent",
-                          message="Notified WebSocket subscribers",
-                          event_type=event.get('type'),
-                          notifications=len(notification_tasks))
+            if self._debug_enabled:
+                self.log.debug("websocket_notifications_sent",
+                              message="Notified WebSocket subscribers",
+                              event_type=event.type,
+                              notifications=len(subscribers))
 
-    @log_function_call(level="DEBUG")
     async def handle_dtmf_event(self, event: DTMFEvent) -> None:
         """
         Handle DTMF event from audio processor and forward to WebSocket.
@@ -193,23 +567,21 @@ class DAHDIInterface(DAHDIHardwareInterface):
             self.debug_stats['dtmf_events'] += 1
             
             # Create WebSocket event
-            websocket_event = {
-                'type': PhoneEventTypes.DTMF,
-                'digit': event.digit,
-                'duration': event.duration,
-                'signal_level': event.signal_level,
-                'timestamp': event.timestamp.isoformat()
-            }
-            
-            # Add to event queue for any direct subscribers
-            await self.event_queue.put(websocket_event)
+            websocket_event = DTMFPayload(
+                DTMF_EVENT,
+                event.digit,
+                event.duration,
+                event.signal_level,
+                event.timestamp
+            )
             
-            # Notify WebSocket subscribers
-            await self._notify_websocket_subscribers(websocket_event)
+            # Queue for the broadcaster, which notifies all subscribers
+            self._publish_event(websocket_event)
             
             self.log.info("dtmf_event_processed",
                          message=f"DTMF event processed: {event.digit}",
-                         event=websocket_event)
+                         digit=event.digit,
+                         duration=event.duration)
             
         except Exception as e:
             self.log.error("dtmf_event_processing_failed",
@@ -225,15 +597,43 @@ class DAHDIInterface(DAHDIHardwareInterface):
             self.log.info("cleanup_start", message="Cleaning up DAHDI interface")
             
             # Clean up FXS port
+            if self._ring_handle:
+                self._ring_handle.cancel()
+                self._ring_handle = None
             if self.fxs_port:
                 await self.fxs_port.cleanup()
             
-            # Cancel monitoring tasks
-            if self.voltage_monitor_task:
-                self.voltage_monitor_task.cancel()
+            # Stop pending batched deliveries
+            for deliver in self._subscriber_snapshot:
+                if isinstance(deliver, _CoalescingCallback):
+                    deliver.cancel()
+            
+            # Cancel monitoring tasks and async subscriber pumps, and wait for
+            # them to finish before the device is closed under them
+            tasks = [task for _, task in self._subscriber_pumps.values()]
+            self._subscriber_pumps.clear()
+            tasks += [task for task in (self.voltage_monitor_task, self.broadcast_task) if task]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.voltage_monitor_task = None
+            self.broadcast_task = None
+            
+            # Let in-flight ioctls finish before their fd is closed (and possibly
+            # reused); shutdown() blocks, so wait for it off the loop
+            if self._ioctl_executor:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._ioctl_executor.shutdown)
+                self._ioctl_executor = None
                 
             # Close device
             if self.device_fd is not None:
+                if self._reader_registered:
+                    asyncio.get_running_loop().remove_reader(self.device_fd)
+                    self._reader_registered = False
+                if self._writer_registered:
+                    asyncio.get_running_loop().remove_writer(self.device_fd)
+                    self._writer_registered = False
                 os.close(self.device_fd)
                 self.device_fd = None
                 
@@ -248,14 +648,11 @@ class DAHDIInterface(DAHDIHardwareInterface):
     async def _configure_device(self) -> None:
         """Configure initial device parameters"""
         try:
-            # Get current parameters
-            params = await self._ioctl(DAHDICommands.GET_PARAMS, struct.pack('I', 0))
-            
-            # Modify parameters as needed
+            # Get current parameters and write them back in one trip to the ioctl thread
             # (Parameters structure depends on specific DAHDI version)
-            
-            # Set parameters
-            await self._ioctl(DAHDICommands.SET_PARAMS, params)
+            await self._ioctl_read_modify_write(DAHDICommands.GET_PARAMS,
+                                                DAHDICommands.SET_PARAMS,
+                                                _ZERO_U32)
             
             self.log.debug("device_configured", message="Device parameters configured")
             
@@ -269,27 +666,35 @@ class DAHDIInterface(DAHDIHardwareInterface):
     @log_function_call(level="DEBUG")
     async def ring(self, duration: int = 2000) -> None:
         """
-        Generate ring signal for specified duration using FXS port.
+        Start a ring signal for the specified duration using the FXS port.
+        Returns once ringing has started; a loop timer returns the line to
+        idle voltage when the duration elapses. A duration of 0 stops an
+        active ring.
         
         Args:
             duration: Ring duration in milliseconds
         """
         try:
+            if duration <= 0:
+                self._stop_ring()
+                return
+            
             if self.state != DAHDIState.ONHOOK:
                 self.log.error("ring_state_error",
                              message="Cannot ring: line not on-hook",
                              current_state=self.state.name)
                 raise DAHDIStateError("Cannot ring: line not on-hook")
             
+            self.fxs_port.set_ring_signal(True)
             self.state = DAHDIState.RINGING
-            await self.fxs_port.ring(duration=duration)
-            self.state = DAHDIState.ONHOOK
+            self._ring_handle = asyncio.get_running_loop().call_later(
+                duration / 1000, self._stop_ring)
             
-            self.log.info("ring_complete",
-                         message=f"Ring signal completed: {duration}ms",
+            self.log.info("ring_started",
+                         message=f"Ring signal started: {duration}ms",
                          duration=duration)
             
-        except FXSError as e:
+        except fxs.FXSError as e:
             self.log.error("ring_failed",
                           message="Ring operation failed",
                           error=str(e),
@@ -298,29 +703,66 @@ class DAHDIInterface(DAHDIHardwareInterface):
             self.debug_stats['errors'] += 1
             raise DAHDIIOError(f"Ring failed: {str(e)}") from e
 
-    @log_function_call(level="DEBUG")
+    def _stop_ring(self) -> None:
+        """
+        End the active timed ring, if any, and return the line to idle voltage.
+        If the idle voltage cannot be restored the line is put in ERROR state.
+        """
+        handle = self._ring_handle
+        if handle is None:
+            return
+        self._ring_handle = None
+        handle.cancel()
+        
+        try:
+            self.fxs_port.set_ring_signal(False)
+        except Exception as e:
+            # Runs from a loop timer, so there is no caller to raise to
+            self.log.error("ring_stop_failed",
+                          message="Failed to return line to idle voltage",
+                          error=str(e))
+            self.debug_stats['errors'] += 1
+            # The line may still carry ring voltage, so it is neither ringing nor idle
+            self.state = DAHDIState.ERROR
+            return
+        
+        # Only report on-hook once the line is actually back at idle voltage
+        if self.state == DAHDIState.RINGING:
+            self.state = DAHDIState.ONHOOK
+        self.log.info("ring_complete", message="Ring signal completed")
+
     async def write_audio(self, audio_data: bytes) -> int:
         """
-        Write audio data to device through FXS port.
+        Queue audio data for transmission to the device.
+        Copies the data into the transmit ring once, waiting for space as needed;
+        acquire_tx_slot() avoids even that copy.
         
         Args:
             audio_data: Raw audio bytes to write
             
         Returns:
-            Number of bytes written
+            Number of bytes queued
         """
         try:
-            await self.fxs_port.play_audio(audio_data)
-            bytes_written = len(audio_data)
-            self.debug_stats['bytes_written'] += bytes_written
-            
-            self.log.debug("audio_written",
-                          message=f"Wrote {bytes_written} audio bytes",
-                          bytes_written=bytes_written,
-                          total_bytes=self.debug_stats['bytes_written'])
+            data = memoryview(audio_data).cast('B')
+            ring = self._tx_ring
+            pos = 0
+            while pos < len(data):
+                chunk = data[pos:pos + ring.size]
+                await self._wait_tx_space(len(chunk))
+                ring.write(chunk)
+                pos += len(chunk)
+                self._start_tx()
+            bytes_written = len(data)
+            
+            if self._debug_enabled:
+                self.log.debug("audio_written",
+                              message=f"Queued {bytes_written} audio bytes",
+                              bytes_written=bytes_written,
+                              total_bytes=self.debug_stats['bytes_written'])
             return bytes_written
             
-        except FXSError as e:
+        except (BufferError, DAHDIIOError) as e:
             self.log.error("write_failed",
                           message="Audio write failed",
                           error=str(e),
@@ -329,36 +771,199 @@ class DAHDIInterface(DAHDIHardwareInterface):
             self.debug_stats['errors'] += 1
             raise DAHDIIOError("Failed to write audio data") from e
 
-    @log_function_call(level="DEBUG")
-    async def read_audio(self, size: int = 160) -> Optional[bytes]:
+    async def acquire_tx_slot(self, size: int) -> Optional[memoryview]:
+        """
+        Reserve transmit ring space to be filled in place, waiting until it is free.
+        The slot is sent once release_tx_slot() is called and must not be used after.
+        
+        Args:
+            size: Number of bytes to reserve, at most the transmit ring size
+            
+        Returns:
+            Writable view of size bytes, or None if the ring storage cannot
+            provide a contiguous slot here (use write_audio() instead)
+        """
+        if size > self._tx_ring.size:
+            raise ValueError(f"Slot size {size} exceeds transmit buffer of {self._tx_ring.size} bytes")
+        await self._wait_tx_space(size)
+        return self._tx_ring.acquire(size)
+    
+    def release_tx_slot(self, nbytes: int) -> None:
+        """
+        Queue the first nbytes of the slot returned by acquire_tx_slot() for transmission.
+        
+        Args:
+            nbytes: Number of bytes filled in the slot
+        """
+        self._tx_ring.commit(nbytes)
+        self._start_tx()
+    
+    async def _wait_tx_space(self, size: int) -> None:
+        """Wait until the transmit ring can take size more bytes"""
+        ring = self._tx_ring
+        while ring.size - len(ring) < size:
+            self._tx_space.clear()
+            await self._tx_space.wait()
+    
+    def _start_tx(self) -> None:
+        """Flush queued audio now and keep a writer callback for whatever the device defers"""
+        if self.device_fd is None:
+            raise DAHDIIOError("DAHDI device is not open")
+        if not self._writer_registered:
+            self._on_dahdi_writable()
+            if len(self._tx_ring):
+                asyncio.get_running_loop().add_writer(self.device_fd, self._on_dahdi_writable)
+                self._writer_registered = True
+    
+    def _on_dahdi_writable(self) -> None:
+        """Event loop writer callback: send queued audio directly from ring memory"""
+        ring = self._tx_ring
+        while len(ring):
+            try:
+                sent = os.write(self.device_fd, ring.peek(len(ring)))
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno == DAHDI_ELAST:
+                    # Channel events are fetched by the reader callback
+                    break
+                # Drop what is queued rather than retrying a failing device
+                self.log.error("device_write_failed",
+                              message="Device write failed",
+                              error=str(e),
+                              dropped_bytes=len(ring))
+                self.debug_stats['errors'] += 1
+                ring.consume(len(ring))
+                break
+            ring.consume(sent)
+            self.debug_stats['bytes_written'] += sent
+        
+        self._tx_space.set()
+        if not len(ring) and self._writer_registered:
+            asyncio.get_running_loop().remove_writer(self.device_fd)
+            self._writer_registered = False
+
+    def _on_dahdi_readable(self) -> None:
+        """
+        Event loop reader callback: move available device audio into the receive ring.
+        Drains up to RX_READ_BATCH frames per wakeup so a backlog costs one
+        loop iteration, and wakes read_audio() once for the whole batch.
+        """
+        fd = self.device_fd
+        read_size = self._read_size
+        ring = self._rx_ring
+        received = False
+        for _ in range(RX_READ_BATCH):
+            try:
+                data = os.read(fd, read_size)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno == DAHDI_ELAST:
+                    # Remaining audio is picked up on the next wakeup
+                    self._handle_dahdi_event()
+                    break
+                self.log.error("device_read_failed",
+                              message="Device read failed",
+                              error=str(e))
+                self.debug_stats['errors'] += 1
+                break
+            if not data:
+                break
+            
+            # A full ring drops the frame; the ring records the overrun
+            if ring.write(data):
+                received = True
+        
+        if received:
+            self._frame_ready.set()
+
+    def _handle_dahdi_event(self) -> None:
+        """Fetch the pending channel event and queue it if it changes the line state"""
+        try:
+            self.debug_stats['ioctl_calls'] += 1
+            result = fcntl.ioctl(self.device_fd, DAHDICommands.GET_EVENT, _ZERO_I32)
+            code = _I32.unpack(result)[0]
+        except OSError as e:
+            self.log.error("get_event_failed",
+                          message="DAHDI_GETEVENT failed",
+                          error=str(e))
+            self.debug_stats['errors'] += 1
+            return
+        
+        if code in _ALARM_EVENTS:
+            self._voltage_check.set()
+            return
+        
+        new_state = _HOOK_EVENT_STATES.get(code)
+        if new_state is None:
+            if self._debug_enabled:
+                self.log.debug("dahdi_event_ignored",
+                              message="Ignoring DAHDI event",
+                              event_code=code)
+            return
+        
+        # Only transitions are reported
+        if new_state == self.state:
+            return
+        self.state = new_state
+        self.debug_stats['state_changes'] += 1
+        self._voltage_check.set()
+        self._publish_event(HookStatePayload(
+            _HOOK_STATE_EVENTS[new_state],
+            datetime.now(timezone.utc)
+        ))
+        self.log.info("hook_state_changed",
+                     message=f"Hook state changed: {new_state.name}",
+                     state=new_state.name)
+
+    async def read_audio(self, size: int = 160, frames: int = 1) -> Optional[memoryview]:
         """
         Read audio data from device through FXS port.
+        Waits until the reader callback has buffered the requested amount.
+        Reading several frames at once processes them in a single pass.
         
         Args:
-            size: Number of bytes to read
+            size: Number of bytes per frame
+            frames: Number of frames to read and process together
             
         Returns:
-            Audio data bytes or None if no data available
+            Byte view of the processed audio; it owns a fresh array per call,
+            so it stays valid after further reads
         """
+        size *= frames
         try:
-            # Read from device
-            audio_data = os.read(self.device_fd, size)
-            if audio_data:
-                # Process through audio processor
-                processed_audio, _ = await self.audio_processor.process_frame(audio_data)
-                audio_data = processed_audio.tobytes()
+            if size > self._rx_ring.size:
+                raise ValueError(f"Read size {size} exceeds receive buffer of {self._rx_ring.size} bytes")
+            
+            # Wait for enough buffered device audio
+            while len(self._rx_ring) < size:
+                self._frame_ready.clear()
+                await self._frame_ready.wait()
+            
+            # Process straight from ring memory when the frames are contiguous
+            # (always, with the mirrored ring); the space is released afterwards
+            ring = self._rx_ring
+            view = ring.peek(size)
+            if len(view) == size:
+                try:
+                    processed_audio, _ = await self.audio_processor.process_frame(view)
+                finally:
+                    ring.consume(size)
+            else:
+                processed_audio, _ = await self.audio_processor.process_frame(ring.read(size))
+            audio_data = memoryview(processed_audio).cast('B')
                 
-            self.debug_stats['bytes_read'] += len(audio_data) if audio_data else 0
+            bytes_read = len(audio_data)
+            self.debug_stats['bytes_read'] += bytes_read
             
-            self.log.debug("audio_read",
-                          message=f"Read {len(audio_data) if audio_data else 0} audio bytes",
-                          bytes_read=len(audio_data) if audio_data else 0,
-                          total_bytes=self.debug_stats['bytes_read'])
+            if self._debug_enabled:
+                self.log.debug("audio_read",
+                              message=f"Read {bytes_read} audio bytes",
+                              bytes_read=bytes_read,
+                              total_bytes=self.debug_stats['bytes_read'])
             return audio_data
             
-        except BlockingIOError:
-            # No data available
-            return None
         except Exception as e:
             self.log.error("read_failed",
                           message="Audio read failed",
@@ -368,36 +973,102 @@ class DAHDIInterface(DAHDIHardwareInterface):
             self.debug_stats['errors'] += 1
             raise DAHDIIOError("Failed to read audio data") from e
 
+    def on_voltage_change(self, callback: Callable[[float], None]) -> None:
+        """
+        Register a callback for line voltage changes.
+        Called from the voltage monitor with each reading that differs from the
+        last reported one by at least VOLTAGE_CHANGE_THRESHOLD; must not block.
+        
+        Args:
+            callback: Function to call with the new voltage in volts
+        """
+        if callback not in self._voltage_listeners:
+            self._voltage_listeners.append(callback)
+
+    def off_voltage_change(self, callback: Callable[[float], None]) -> None:
+        """
+        Unregister a callback previously passed to on_voltage_change().
+        
+        Args:
+            callback: Function to stop calling on voltage changes
+        """
+        if callback in self._voltage_listeners:
+            self._voltage_listeners.remove(callback)
+
     async def _monitor_voltage(self) -> None:
-        """Monitor line voltage and generate events"""
+        """
+        Periodically check line voltage and generate events when it changes.
+        Hook state changes arrive through DAHDI events, so this is only a health check;
+        hook and alarm events wake it early instead of waiting out the interval,
+        and the line is re-read quickly until the voltage settles.
+        Failures are retried with exponential backoff; the monitor stops after
+        VOLTAGE_MAX_FAILURES consecutive failures.
+        """
+        failures = 0
+        # Consecutive readings without a reported change; the wait grows with it
+        stable = 0
         while True:
             try:
-                # Read line voltage
-                voltage_data = await self._ioctl(DAHDICommands.LINE_VOLTAGE, struct.pack('I', 0))
-                voltage = struct.unpack('f', voltage_data)[0]
+                # Read line voltage; a status read, so no executor round trip
+                voltage_data = self._ioctl_nowait(DAHDICommands.LINE_VOLTAGE, _ZERO_U32)
+                voltage = _F32.unpack(voltage_data)[0]
+                failures = 0
                 
-                # Generate voltage event
-                await self.event_queue.put({
-                    'type': 'voltage',
-                    'value': voltage,
-                    'timestamp': datetime.utcnow().isoformat()
-                })
+                # Generate voltage event only on a meaningful change
+                if (self._last_voltage is None or
+                        abs(voltage - self._last_voltage) >= VOLTAGE_CHANGE_THRESHOLD):
+                    self._last_voltage = voltage
+                    self._publish_event(VoltagePayload(
+                        VOLTAGE_EVENT,
+                        voltage,
+                        datetime.now(timezone.utc)
+                    ))
+                    for listener in self._voltage_listeners:
+                        try:
+                            listener(voltage)
+                        except Exception as e:
+                            self.log.warning("voltage_listener_failed",
+                                            message="Voltage listener raised",
+                                            error=str(e))
+                    stable = 0
+                elif stable < 8:
+                    stable += 1
                 
-                self.log.debug("voltage_reading",
-                             message=f"Line voltage: {voltage}V",
-                             voltage=voltage)
-                await asyncio.sleep(1)  # Check voltage every second
+                if self._debug_enabled:
+                    self.log.debug("voltage_reading",
+                                 message=f"Line voltage: {voltage}V",
+                                 voltage=voltage)
+                interval = min(VOLTAGE_POLL_INTERVAL, VOLTAGE_SETTLE_INTERVAL * (1 << stable))
+                try:
+                    await asyncio.wait_for(self._voltage_check.wait(), interval)
+                    # Woken by a DAHDI event: the line may be changing again
+                    stable = 0
+                except asyncio.TimeoutError:
+                    pass
+                self._voltage_check.clear()
                 
             except Exception as e:
-                self.log.error("voltage_monitor_error",
-                             message="Voltage monitoring error",
-                             error=str(e),
-                             exc_info=True)
-                await asyncio.sleep(5)  # Retry after error
+                failures += 1
+                if failures >= VOLTAGE_MAX_FAILURES:
+                    self.log.error("voltage_monitor_stopped",
+                                 message="Voltage monitoring stopped after repeated failures",
+                                 failures=failures,
+                                 error=str(e),
+                                 exc_info=True)
+                    return
+                delay = min(VOLTAGE_RETRY_MAX_DELAY, float(1 << failures))
+                self.log.warning("voltage_monitor_error",
+                               message="Voltage monitoring error, retrying",
+                               failures=failures,
+                               retry_in=delay,
+                               error=str(e))
+                await asyncio.sleep(delay)
 
     async def _ioctl(self, command: DAHDICommands, data: bytes) -> bytes:
         """
         Execute ioctl command with error handling.
+        Runs on the dedicated ioctl thread so a slow driver call does not
+        stall the event loop.
         
         Args:
             command: DAHDI command code
@@ -408,7 +1079,10 @@ class DAHDIInterface(DAHDIHardwareInterface):
         """
         try:
             self.debug_stats['ioctl_calls'] += 1
-            result = fcntl.ioctl(self.device_fd, command, data)
+            if self._ioctl_executor is None:
+                raise DAHDIIOError("Device is not open")
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._ioctl_executor, fcntl.ioctl, self.device_fd, command, data)
             return result
         except Exception as e:
             self.log.error("ioctl_failed",
@@ -419,14 +1093,86 @@ class DAHDIInterface(DAHDIHardwareInterface):
             self.debug_stats['errors'] += 1
             raise DAHDIIOError(f"ioctl command {command.name} failed") from e
 
-    @log_function_call(level="DEBUG")
-    async def get_next_event(self) -> Optional[Dict[str, Any]]:
-        """Get next event from queue if available"""
+    def _ioctl_nowait(self, command: DAHDICommands, data: bytes) -> bytes:
+        """
+        Execute an ioctl command inline on the event loop thread.
+        Only for commands the driver answers immediately, such as register and
+        status reads, where the executor round trip would cost more than the call.
+        
+        Args:
+            command: DAHDI command code
+            data: Command data bytes
+            
+        Returns:
+            Response data bytes
+        """
+        try:
+            self.debug_stats['ioctl_calls'] += 1
+            if self.device_fd is None:
+                raise DAHDIIOError("Device is not open")
+            return fcntl.ioctl(self.device_fd, command, data)
+        except Exception as e:
+            self.log.error("ioctl_failed",
+                          message=f"ioctl failed: {command.name}",
+                          command=command.name,
+                          error=str(e),
+                          exc_info=True)
+            self.debug_stats['errors'] += 1
+            raise DAHDIIOError(f"ioctl command {command.name} failed") from e
+
+    async def _ioctl_read_modify_write(self, get_command: DAHDICommands,
+                                       set_command: DAHDICommands, data: bytes,
+                                       modify: Optional[Callable[[bytes], bytes]] = None) -> bytes:
+        """
+        Run a get ioctl and the matching set ioctl back to back as one job on the
+        ioctl thread, so the pair costs a single executor round trip and no other
+        ioctl can run between them.
+        
+        Args:
+            get_command: DAHDI command reading the current value
+            set_command: DAHDI command writing the new value
+            data: Argument bytes for the get command
+            modify: Optional function mapping the current value to the new one
+            
+        Returns:
+            Value written by the set command
+        """
+        def run(fd: int) -> bytes:
+            current = fcntl.ioctl(fd, get_command, data)
+            updated = modify(current) if modify else current
+            fcntl.ioctl(fd, set_command, updated)
+            return updated
+        
+        try:
+            self.debug_stats['ioctl_calls'] += 2
+            if self._ioctl_executor is None:
+                raise DAHDIIOError("Device is not open")
+            return await asyncio.get_running_loop().run_in_executor(
+                self._ioctl_executor, run, self.device_fd)
+        except Exception as e:
+            self.log.error("ioctl_failed",
+                          message=f"ioctl failed: {get_command.name}/{set_command.name}",
+                          command=f"{get_command.name}/{set_command.name}",
+                          error=str(e),
+                          exc_info=True)
+            self.debug_stats['errors'] += 1
+            raise DAHDIIOError(f"ioctl commands {get_command.name}/{set_command.name} failed") from e
+
+    async def get_next_event(self) -> Optional[EventPayload]:
+        """
+        Get next event from the internal queue.
+        The broadcaster task is the queue's consumer; clients should use
+        open_event_stream() instead so they do not take events from each other.
+        """
         try:
-            event = await self.event_queue.get()
-            self.log.debug("event_retrieved",
-                          message="Retrieved event from queue",
-                          event_type=event.get('type'))
+            while not self._events:
+                self._event_ready.clear()
+                await self._event_ready.wait()
+            event = self._events.popleft()
+            if self._debug_enabled:
+                self.log.debug("event_retrieved",
+                              message="Retrieved event from queue",
+                              event_type=event.type)
             return event
         except Exception as e:
             self.log.error("event_retrieval_error",
@@ -441,7 +1187,10 @@ class DAHDIInterface(DAHDIHardwareInterface):
             **self.debug_stats,
             'state': self.state.name,
             'device_fd': self.device_fd,
-            'event_queue_size': self.event_queue.qsize(),
+            'event_queue_size': len(self._events),
+            'event_streams': len(self._event_streams),
+            'rx_ring': self._rx_ring.get_stats(),
+            'tx_ring': self._tx_ring.get_stats(),
             'fxs_stats': await self.fxs_port.get_debug_info() if self.fxs_port else None,
             'audio_processor_stats': await self.audio_processor.get_debug_info()
         }
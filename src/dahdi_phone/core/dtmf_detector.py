@@ -7,11 +7,12 @@ Handles tone detection, validation, and event generation with detailed logging.
 
 import numpy as np
 import logging
-from typing import Optional, Dict, Tuple
+import time
+from typing import Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 
-from ..utils.logger import DAHDILogger, log_function_call
+from ..utils.logger import DAHDILogger
 from ..api.models import DTMFEvent
 
 # Get structured logger
@@ -37,19 +38,14 @@ class DTMFDetector:
         'high': [1209, 1336, 1477, 1633]
     }
 
-    # DTMF digit mapping
-    DTMF_DIGITS = [
-        ['1', '2', '3', 'A'],
-        ['4', '5', '6', 'B'],
-        ['7', '8', '9', 'C'],
-        ['*', '0', '#', 'D']
-    ]
+    # DTMF digit mapping, row-major: low tone index * 4 + high tone index
+    DTMF_DIGITS = '123A456B789C*0#D'
 
     def __init__(self, config: DTMFConfig):
         self.config = config
         self._current_digit: Optional[str] = None
-        self._digit_start: Optional[datetime] = None
-        self._prev_energies: Dict[int, float] = {}
+        self._digit_start_ns: Optional[int] = None
+        self._prev_energies = np.full(8, -96.0)
         
         # Initialize Goertzel coefficients
         self._init_goertzel_coeffs()
@@ -62,26 +58,47 @@ class DTMFDetector:
 
     def _setup_logging(self) -> None:
         """Configure DTMF-specific logging"""
+        # Checked once so the per-frame path skips debug event construction
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
         self.debug_stats = {
             'frames_processed': 0,
             'tones_detected': 0,
             'false_positives': 0,
             'detection_errors': 0
         }
-        logger.debug("debug_stats_initialized",
-                    message="DTMF debug statistics initialized",
-                    initial_stats=self.debug_stats)
+        if self._debug_enabled:
+            logger.debug("debug_stats_initialized",
+                        message="DTMF debug statistics initialized",
+                        initial_stats=self.debug_stats)
 
     def _init_goertzel_coeffs(self) -> None:
         """Initialize Goertzel algorithm coefficients for each DTMF frequency"""
-        self.coeffs = {}
-        for freq_list in self.DTMF_FREQS.values():
-            for freq in freq_list:
-                k = int(0.5 + freq * self.config.frame_size / self.config.sample_rate)
-                w = 2 * np.pi * k / self.config.frame_size
-                self.coeffs[freq] = 2 * np.cos(w)
+        # Frequency groups as arrays; energies are indexed in _all_freqs order,
+        # so the low group is [:4] and the high group is [4:]
+        self._low_freqs = np.array(self.DTMF_FREQS['low'])
+        self._high_freqs = np.array(self.DTMF_FREQS['high'])
+        self._all_freqs = np.concatenate((self._low_freqs, self._high_freqs))
+        
+        frame_size = self.config.frame_size
+        bins = np.floor(0.5 + self._all_freqs * frame_size / self.config.sample_rate)
+        self._omegas = 2 * np.pi * bins / frame_size
+        self.coeffs = dict(zip(self._all_freqs.tolist(), (2 * np.cos(self._omegas)).tolist()))
+        
+        self._basis = self._goertzel_basis(self.config.frame_size)
+        
+        # Scratch buffers reused by every _calculate_energies call
+        self._projection = np.empty(16, dtype=np.float64)
+        self._energy = np.empty(8, dtype=np.float64)
+
+    def _goertzel_basis(self, length: int) -> np.ndarray:
+        """
+        Build the (16, length) cosine/sine projection matrix for all DTMF bins.
+        The final Goertzel power s1^2 + s2^2 - coeff*s1*s2 equals |sum x[n] e^(-jwn)|^2,
+        so projecting a frame onto these rows yields all eight results in one product.
+        """
+        phase = np.outer(self._omegas, np.arange(length))
+        return np.concatenate((np.cos(phase), np.sin(phase)))
 
-    @log_function_call(level="DEBUG")
     async def process_frame(self, frame: np.ndarray) -> Optional[DTMFEvent]:
         """
         Process an audio frame for DTMF detection.
@@ -94,9 +111,10 @@ class DTMFDetector:
         """
         try:
             self.debug_stats['frames_processed'] += 1
+            now_ns = time.monotonic_ns()
             
             # Calculate energies at DTMF frequencies
-            energies = self._calculate_energies(frame)
+            energies, max_energy = self._calculate_energies(frame)
             
             # Detect DTMF digit
             digit = self._detect_digit(energies)
@@ -105,31 +123,32 @@ class DTMFDetector:
                 if self._current_digit != digit:
                     # New digit detected
                     self._current_digit = digit
-                    self._digit_start = datetime.utcnow()
-                    logger.debug("new_digit_detected",
-                               message=f"New DTMF digit detected: {digit}",
-                               digit=digit,
-                               energies=energies)
+                    self._digit_start_ns = now_ns
+                    if self._debug_enabled:
+                        logger.debug("new_digit_detected",
+                                   message=f"New DTMF digit detected: {digit}",
+                                   digit=digit,
+                                   energies=dict(zip(self._all_freqs.tolist(), energies.tolist())))
                 
-                elif (datetime.utcnow() - self._digit_start).total_seconds() * 1000 >= self.config.min_duration:
+                elif (now_ns - self._digit_start_ns) // 1_000_000 >= self.config.min_duration:
                     # Valid DTMF tone
                     self.debug_stats['tones_detected'] += 1
                     event = DTMFEvent(
                         digit=digit,
-                        duration=int((datetime.utcnow() - self._digit_start).total_seconds() * 1000),
-                        signal_level=max(energies.values()),
-                        timestamp=datetime.utcnow()
+                        duration=(now_ns - self._digit_start_ns) // 1_000_000,
+                        signal_level=max_energy,
+                        timestamp=datetime.now(timezone.utc)
                     )
                     logger.info("dtmf_tone_detected",
                               message=f"Valid DTMF tone detected: {digit}",
-                              event=vars(event))
+                              dtmf_event=vars(event))
                     return event
                     
             else:
                 self._current_digit = None
-                self._digit_start = None
+                self._digit_start_ns = None
             
-            self._prev_energies = energies
+            np.copyto(self._prev_energies, energies)
             return None
             
         except Exception as e:
@@ -140,7 +159,7 @@ class DTMFDetector:
                         exc_info=True)
             raise
 
-    def _calculate_energies(self, frame: np.ndarray) -> Dict[int, float]:
+    def _calculate_energies(self, frame: np.ndarray) -> Tuple[np.ndarray, float]:
         """
         Calculate signal energy at each DTMF frequency using Goertzel algorithm.
         
@@ -148,54 +167,47 @@ class DTMFDetector:
             frame: Audio frame data
             
         Returns:
-            Dictionary of frequency energies
+            Tuple of (energies in dB, low group then high group, peak energy).
+            The array is a reused buffer, valid until the next call.
         """
-        energies = {}
+        samples = np.asarray(frame, dtype=np.float64)
+        length = samples.shape[0]
+        if length > self._basis.shape[1]:
+            self._basis = self._goertzel_basis(length)
         
-        for freq_list in self.DTMF_FREQS.values():
-            for freq in freq_list:
-                # Goertzel algorithm implementation
-                coeff = self.coeffs[freq]
-                s0, s1, s2 = 0.0, 0.0, 0.0
-                
-                for sample in frame:
-                    s0 = sample + coeff * s1 - s2
-                    s2 = s1
-                    s1 = s0
-                
-                # Calculate energy
-                energy = np.sqrt(s1*s1 + s2*s2 - coeff*s1*s2)
-                energy_db = 20 * np.log10(energy) if energy > 0 else -96.0
-                energies[freq] = energy_db
-                
-        return energies
+        # Goertzel magnitudes for all eight frequencies in one projection
+        projection = np.matmul(self._basis[:, :length], samples, out=self._projection)
+        energy = np.hypot(projection[:8], projection[8:], out=self._energy)
+        silent = energy <= 0
+        
+        # Convert to dB in place, with -96 dB for silence
+        with np.errstate(divide='ignore'):
+            np.log10(energy, out=energy)
+        energy *= 20
+        energy[silent] = -96.0
+        
+        return energy, float(energy.max())
 
-    def _detect_digit(self, energies: Dict[int, float]) -> Optional[str]:
+    def _detect_digit(self, energies: np.ndarray) -> Optional[str]:
         """
         Detect DTMF digit from frequency energies.
         
         Args:
-            energies: Dictionary of frequency energies
+            energies: Array of frequency energies, low group then high group
             
         Returns:
             Detected digit or None
         """
         # Find strongest frequency in each group
-        strongest_low = max(self.DTMF_FREQS['low'], 
-                          key=lambda f: energies[f])
-        strongest_high = max(self.DTMF_FREQS['high'],
-                           key=lambda f: energies[f])
+        row = int(np.argmax(energies[:4]))
+        col = int(np.argmax(energies[4:]))
         
         # Check if energies exceed threshold
-        if (energies[strongest_low] < self.config.detection_threshold or
-            energies[strongest_high] < self.config.detection_threshold):
+        if (energies[row] < self.config.detection_threshold or
+            energies[4 + col] < self.config.detection_threshold):
             return None
             
-        # Get indices for digit lookup
-        row = self.DTMF_FREQS['low'].index(strongest_low)
-        col = self.DTMF_FREQS['high'].index(strongest_high)
-        
-        return self.DTMF_DIGITS[row][col]
+        return self.DTMF_DIGITS[row * 4 + col]
 
     async def get_debug_info(self) -> dict:
         """Get debug statistics and state information"""
@@ -6,8 +6,7 @@ and high-level FXS implementation.
 """
 
 from enum import IntEnum
-from typing import Protocol, Dict, Any, Optional
-import asyncio
+from typing import Protocol, Dict, Any, Optional, Callable
 
 class DAHDIIOError(Exception):
     """Custom exception for DAHDI I/O operations"""
@@ -32,6 +31,19 @@ class DAHDICommands(IntEnum):
     SET_BUFINFO = 0x40044807
     AUDIO_GAIN = 0x40044808
     LINE_VOLTAGE = 0x40044809
+    GET_EVENT = 0x8004DA08  # DAHDI_GETEVENT: _IOR(DAHDI_CODE, 8, int)
+
+class DAHDIEvent(IntEnum):
+    """Channel event codes returned by DAHDI_GETEVENT"""
+    NONE = 0
+    ONHOOK = 1
+    RINGOFFHOOK = 2
+    WINKFLASH = 3
+    ALARM = 4
+    NOALARM = 5
+    RINGERON = 10
+    RINGEROFF = 11
+    RINGBEGIN = 18
 
 class DAHDIState(IntEnum):
     """DAHDI hardware states"""
@@ -47,12 +59,23 @@ class DAHDIHardwareInterface(Protocol):
     device_path: str
     device_fd: Optional[int]
     state: DAHDIState
-    event_queue: asyncio.Queue
 
     async def initialize(self) -> None:
         """Initialize hardware interface"""
         ...
 
+    async def get_next_event(self) -> Optional[Any]:
+        """Wait for the next event from the hardware"""
+        ...
+
+    def on_voltage_change(self, callback: Callable[[float], None]) -> None:
+        """Register a callback invoked with the line voltage whenever it changes"""
+        ...
+
+    def off_voltage_change(self, callback: Callable[[float], None]) -> None:
+        """Unregister a callback previously registered with on_voltage_change"""
+        ...
+
     async def cleanup(self) -> None:
         """Clean up hardware resources"""
         ...
@@ -61,11 +84,15 @@ class DAHDIHardwareInterface(Protocol):
         """Execute ioctl command"""
         ...
 
+    def _ioctl_nowait(self, command: DAHDICommands, data: bytes) -> bytes:
+        """Execute an immediate ioctl command inline"""
+        ...
+
     async def write_audio(self, audio_data: bytes) -> int:
         """Write audio data to device"""
         ...
 
-    async def read_audio(self, size: int = 160) -> Optional[bytes]:
+    async def read_audio(self, size: int = 160) -> Optional[memoryview]:
         """Read audio data from device"""
         ...
 
@@ -54,7 +54,7 @@ class StateManager:
         self._subscribers = set()
         self._line_voltage = 48.0  # Default FXS voltage
         self._call_stats = CallStatistics()
-        self._config = Config()
+        self._config = Config.get()
         self._last_error: Optional[str] = None
         
         # DTMF tracking
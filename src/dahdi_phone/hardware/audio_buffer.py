@@ -11,7 +11,7 @@ import collections
 from typing import Optional, Tuple
 import numpy as np
 import logging
-from ..utils.logger import DAHDILogger, log_function_call
+from ..utils.logger import DAHDILogger
 
 # Configure module logger
 logger = DAHDILogger().get_logger(__name__)
@@ -61,6 +61,8 @@ class AudioBuffer:
             'underflows': 0,
             'dropped_samples': 0
         }
+        # Checked once so per-frame reads and writes skip debug event construction
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         logger.info(
             "audio_buffer_initialized",
@@ -82,7 +84,6 @@ class AudioBuffer:
         with self._lock:
             return self._buffer.maxlen - len(self._buffer)
 
-    @log_function_call(level="DEBUG")
     async def write(self, 
                    data: bytes,
                    timeout: Optional[float] = None) -> Tuple[int, int]:
@@ -138,12 +139,13 @@ class AudioBuffer:
                 # Notify readers
                 self._not_empty.notify()
                 
-                logger.debug(
-                    "audio_data_written",
-                    samples_written=samples_to_write,
-                    samples_dropped=dropped,
-                    buffer_utilization=len(self._buffer)/self._buffer.maxlen
-                )
+                if self._debug_enabled:
+                    logger.debug(
+                        "audio_data_written",
+                        samples_written=samples_to_write,
+                        samples_dropped=dropped,
+                        buffer_utilization=len(self._buffer)/self._buffer.maxlen
+                    )
                 
                 return samples_to_write, dropped
                 
@@ -156,7 +158,6 @@ class AudioBuffer:
             )
             raise AudioBufferError(f"Buffer write failed: {str(e)}") from e
 
-    @log_function_call(level="DEBUG")
     async def read(self,
                   samples: int,
                   timeout: Optional[float] = None) -> Optional[bytes]:
@@ -197,11 +198,12 @@ class AudioBuffer:
                 # Convert to bytes
                 audio_data = np.array(result, dtype=np.int16).tobytes()
                 
-                logger.debug(
-                    "audio_data_read",
-                    samples_read=samples,
-                    buffer_utilization=len(self._buffer)/self._buffer.maxlen
-                )
+                if self._debug_enabled:
+                    logger.debug(
+                        "audio_data_read",
+                        samples_read=samples,
+                        buffer_utilization=len(self._buffer)/self._buffer.maxlen
+                    )
                 
                 return audio_data
                 
@@ -9,9 +9,10 @@ Includes comprehensive logging and error handling for hardware operations.
 import asyncio
 import ctypes
 import logging
+import struct
 from enum import IntEnum
 from typing import Optional, Dict, Any, List, Union, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ..utils.logger import DAHDILogger, log_function_call
 from ..utils.config import Config
@@ -54,12 +55,21 @@ class VoltageData(ctypes.Structure):
         ("flags", ctypes.c_uint32)      # Control flags
     ]
 
+# Precompiled layout matching VoltageData, for packing/unpacking without ctypes objects
+_VOLTAGE_DATA = struct.Struct('fiI')
+
 @dataclass
 class RingConfig:
     """Ring pattern configuration"""
     on_times: List[int]    # List of ring-on durations in ms
     off_times: List[int]   # List of ring-off durations in ms
     repeat: int = 1        # Number of times to repeat pattern (0 for infinite)
+    # (on, off) durations in seconds, derived once from the lists above
+    compiled: Tuple[Tuple[float, float], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.compiled = tuple((on_time / 1000, off_time / 1000)
+                              for on_time, off_time in zip(self.on_times, self.off_times))
 
 # Predefined patterns
 RING_PATTERNS = {
@@ -97,7 +107,23 @@ RING_PATTERNS = {
 }
 
 
-@dataclass
+# Zeroed per-port debug counters, copied for each FXSPort
+_DEBUG_STATS_TEMPLATE = {
+    'ring_cycles': 0,
+    'off_hook_events': 0,
+    'voltage_changes': 0,
+    'audio_errors': 0,
+    'hardware_errors': 0
+}
+
+
+def _resolve(future: asyncio.Future) -> None:
+    """Loop timer callback completing a future that may already be done"""
+    if not future.done():
+        future.set_result(None)
+
+
+@dataclass(frozen=True, eq=False)
 class FXSConfig:
     """FXS port configuration parameters"""
     channel: int
@@ -116,8 +142,22 @@ class FXSPort:
         self.dahdi = dahdi
         self.audio = audio
         self._ring_task: Optional[asyncio.Task] = None
+        self._monitor_task: Optional[asyncio.Task] = None
         self._monitoring = False
         
+        # Latest voltage pushed by the DAHDI interface, and its wakeup signal
+        self._latest_voltage: Optional[float] = None
+        self._voltage_event = asyncio.Event()
+        
+        # Voltage query argument is constant for this channel, so pack it once
+        self._voltage_query = _VOLTAGE_DATA.pack(0.0, config.channel, 0)
+        # Ring and idle transitions as prepacked (command, data) pairs; the
+        # config is frozen, so they stay valid for the life of the port
+        self._ring_voltage_args = (DAHDIVoltageCommands.DAHDI_RING_VOLTAGE,
+                                   _VOLTAGE_DATA.pack(config.ring_voltage, config.channel, 0))
+        self._idle_voltage_args = (DAHDIVoltageCommands.DAHDI_SET_VOLTAGE,
+                                   _VOLTAGE_DATA.pack(config.idle_voltage, config.channel, 0))
+        
         # Initialize logger with context
         self.log = logger.bind(
             channel=config.channel,
@@ -129,16 +169,13 @@ class FXSPort:
 
     def _setup_logging(self) -> None:
         """Configure FXS-specific logging"""
-        self.debug_stats = {
-            'ring_cycles': 0,
-            'off_hook_events': 0,
-            'voltage_changes': 0,
-            'audio_errors': 0,
-            'hardware_errors': 0
-        }
-        self.log.debug("debug_stats_initialized", 
-                      message="FXS debug statistics initialized",
-                      initial_stats=self.debug_stats)
+        # Checked once so the audio path skips debug event construction
+        self._debug_enabled = self.log.isEnabledFor(logging.DEBUG)
+        self.debug_stats = _DEBUG_STATS_TEMPLATE.copy()
+        if self._debug_enabled:
+            self.log.debug("debug_stats_initialized", 
+                          message="FXS debug statistics initialized",
+                          initial_stats=self.debug_stats)
 
     @log_function_call(level="DEBUG")
     async def initialize(self) -> None:
@@ -149,9 +186,10 @@ class FXSPort:
             # Set initial line voltage
             await self._set_voltage(self.config.idle_voltage)
             
-            # Start monitoring task
+            # Start monitoring task, fed by voltage change notifications
             self._monitoring = True
-            asyncio.create_task(self._monitor_hardware())
+            self.dahdi.on_voltage_change(self._on_voltage)
+            self._monitor_task = asyncio.create_task(self._monitor_hardware())
             
             self.log.info("initialization_complete", 
                          message="FXS port initialized successfully")
@@ -170,12 +208,15 @@ class FXSPort:
         try:
             self.log.info("cleanup_start", message="Starting FXS port cleanup")
             
-            # Stop monitoring
+            # Stop monitoring and any active ring, and wait for both to finish
             self._monitoring = False
-            
-            # Cancel ring task if active
-            if self._ring_task:
-                self._ring_task.cancel()
+            self.dahdi.off_voltage_change(self._on_voltage)
+            tasks = [task for task in (self._monitor_task, self._ring_task) if task]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._monitor_task = None
+            self._ring_task = None
                 
             # Reset line voltage
             await self._set_voltage(self.config.idle_voltage)
@@ -188,24 +229,32 @@ class FXSPort:
                           error=str(e),
                           exc_info=True)
 
+    def _on_voltage(self, voltage: float) -> None:
+        """Voltage change callback registered with the DAHDI interface"""
+        self._latest_voltage = voltage
+        self._voltage_event.set()
+
     async def _monitor_hardware(self) -> None:
-        """Monitor hardware state and voltage"""
+        """Monitor hardware state as voltage changes are reported"""
+        # 20% voltage drop indicates off-hook
+        off_hook_voltage = self.config.idle_voltage * 0.8
         while self._monitoring:
             try:
-                # Check line voltage
-                voltage = await self._get_voltage()
-                self.log.debug("voltage_reading",
-                             message=f"Line voltage: {voltage}V",
-                             voltage=voltage)
+                # Wait for the next reported voltage change
+                await self._voltage_event.wait()
+                self._voltage_event.clear()
+                voltage = self._latest_voltage
+                if self._debug_enabled:
+                    self.log.debug("voltage_reading",
+                                 message=f"Line voltage: {voltage}V",
+                                 voltage=voltage)
                 
                 # Check for off-hook state
-                if voltage < self.config.idle_voltage * 0.8:  # 20% voltage drop indicates off-hook
+                if voltage < off_hook_voltage:
                     self.debug_stats['off_hook_events'] += 1
                     self.log.info("off_hook_detected",
                                 message="Off-hook state detected",
                                 voltage=voltage)
-                    
-                await asyncio.sleep(0.1)  # Check every 100ms
                 
             except Exception as e:
                 self.log.error("monitoring_error",
@@ -259,6 +308,21 @@ class FXSPort:
                           exc_info=True)
             raise
 
+    def set_ring_signal(self, active: bool) -> None:
+        """
+        Switch the line between ring and idle voltage immediately.
+        Lets callers time a plain ring with a loop timer instead of a task.
+        
+        Args:
+            active: True to apply ring voltage, False to return to idle voltage
+            
+        Raises:
+            FXSError: If voltage setting fails
+        """
+        self._apply_voltage(*(self._ring_voltage_args if active else self._idle_voltage_args))
+        if active:
+            self.debug_stats['ring_cycles'] += 1
+
     async def _generate_ring_pattern(self, pattern: RingConfig) -> None:
         """
         Generate specific ring pattern.
@@ -266,49 +330,82 @@ class FXSPort:
         Args:
             pattern: RingPattern configuration to generate
         """
+        # Lay out one cycle as (offset, (command, data)) edges from the prepacked
+        # transitions; each cycle is then scheduled as loop timers against an
+        # absolute base time, so there is one await per cycle and no drift
+        ring_edge = self._ring_voltage_args
+        idle_edge = self._idle_voltage_args
+        edges = []
+        offset = 0.0
+        for on_secs, off_secs in pattern.compiled:
+            edges.append((offset, ring_edge))
+            offset += on_secs
+            edges.append((offset, idle_edge))
+            offset += off_secs
+        cycle_secs = offset
+        
+        loop = asyncio.get_running_loop()
+        handles: List[asyncio.TimerHandle] = []
         try:
             repeat_count = 0
+            base = loop.time()
             while pattern.repeat == 0 or repeat_count < pattern.repeat:
-                # Execute one complete pattern cycle
-                for on_time, off_time in zip(pattern.on_times, pattern.off_times):
-                    # Set ring voltage
-                    await self._set_voltage(self.config.ring_voltage)
-                    await asyncio.sleep(on_time / 1000)
-                    
-                    # Set idle voltage
-                    await self._set_voltage(self.config.idle_voltage)
-                    if off_time > 0:  # Skip final off time if 0
-                        await asyncio.sleep(off_time / 1000)
+                # Execute one complete pattern cycle; an edge failure fails the cycle
+                cycle_done = loop.create_future()
+                handles = [loop.call_at(base + edge_offset, self._ring_edge, cycle_done, *edge)
+                           for edge_offset, edge in edges]
+                handles.append(loop.call_at(base + cycle_secs, _resolve, cycle_done))
+                await cycle_done
+                base += cycle_secs
                 
                 repeat_count += 1
                 self.debug_stats['ring_cycles'] += 1
                 
-                self.log.debug("ring_cycle_complete",
-                             message="Completed ring pattern cycle",
-                             cycle=repeat_count,
-                             max_cycles=pattern.repeat)
+                if self._debug_enabled:
+                    self.log.debug("ring_cycle_complete",
+                                 message="Completed ring pattern cycle",
+                                 cycle=repeat_count,
+                                 max_cycles=pattern.repeat)
                 
         finally:
+            for handle in handles:
+                handle.cancel()
             # Ensure we return to idle voltage
-            await self._set_voltage(self.config.idle_voltage)
-            
-    async def _ring_cycle(self, on_time: int, off_time: int) -> None:
-        """Execute single ring cycle"""
+            self._apply_voltage(*self._idle_voltage_args)
+
+    def _ring_edge(self, cycle_done: asyncio.Future,
+                   command: DAHDIVoltageCommands, data_bytes: bytes) -> None:
+        """Loop timer callback applying one ring pattern edge"""
         try:
-            # Set ring voltage
-            await self._set_voltage(self.config.ring_voltage)
-            await asyncio.sleep(on_time / 1000)
+            self._apply_voltage(command, data_bytes)
+        except Exception as e:
+            # Raised inside a loop callback, so hand it to the awaiting generator
+            if not cycle_done.done():
+                cycle_done.set_exception(e)
             
-            # Reset to idle voltage
-            await self._set_voltage(self.config.idle_voltage)
-            await asyncio.sleep(off_time / 1000)
+    def _apply_voltage(self, command: DAHDIVoltageCommands, data_bytes: bytes) -> None:
+        """
+        Issue a prepacked voltage ioctl inline on the event loop thread.
+        Used for ring edges, where the line feed write returns immediately and
+        an executor round trip per edge would only add jitter to the cadence.
+        
+        Args:
+            command: Voltage command to issue
+            data_bytes: Packed voltage control structure
             
-        except Exception as e:
-            self.log.error("ring_cycle_failed",
-                          message="Ring cycle failed",
+        Raises:
+            FXSError: If voltage setting fails
+        """
+        try:
+            self.dahdi._ioctl_nowait(command, data_bytes)
+            self.debug_stats['voltage_changes'] += 1
+        except DAHDIIOError as e:
+            self.log.error("voltage_set_failed",
+                          message="Failed to set line voltage",
+                          command=command.name,
                           error=str(e),
                           exc_info=True)
-            raise
+            raise FXSError(f"Failed to apply {command.name}") from e
 
     async def _set_voltage(self, voltage: float) -> None:
         """
@@ -321,14 +418,8 @@ class FXSPort:
             FXSError: If voltage setting fails
         """
         try:
-            # Prepare voltage control data structure
-            voltage_data = VoltageData()
-            voltage_data.voltage = voltage
-            voltage_data.channel = self.config.channel
-            voltage_data.flags = 0  # Normal voltage set operation
-            
-            # Convert to bytes for ioctl
-            data_bytes = bytes(voltage_data)
+            # Pack voltage control data structure (flags 0: normal voltage set operation)
+            data_bytes = _VOLTAGE_DATA.pack(voltage, self.config.channel, 0)
             
             # Determine appropriate command based on voltage type
             if voltage == self.config.ring_voltage:
@@ -341,11 +432,12 @@ class FXSPort:
             
             self.debug_stats['voltage_changes'] += 1
             
-            self.log.debug("voltage_set",
-                          message=f"Set line voltage to {voltage}V",
-                          voltage=voltage,
-                          command=command.name,
-                          channel=self.config.channel)
+            if self._debug_enabled:
+                self.log.debug("voltage_set",
+                              message=f"Set line voltage to {voltage}V",
+                              voltage=voltage,
+                              command=command.name,
+                              channel=self.config.channel)
             
         except DAHDIIOError as e:
             self.log.error("voltage_set_failed",
@@ -366,28 +458,20 @@ class FXSPort:
             FXSError: If voltage reading fails
         """
         try:
-            # Prepare voltage query structure
-            query_data = VoltageData()
-            query_data.channel = self.config.channel
-            query_data.flags = 0
-            
-            # Convert to bytes for ioctl
-            data_bytes = bytes(query_data)
-            
-            # Execute ioctl call
+            # Execute ioctl call with the prepacked query structure
             result_bytes = await self.dahdi._ioctl(
                 DAHDIVoltageCommands.DAHDI_GET_VOLTAGE, 
-                data_bytes
+                self._voltage_query
             )
             
-            # Convert result back to voltage data structure
-            result_data = VoltageData.from_buffer_copy(result_bytes)
-            voltage = result_data.voltage
+            # Unpack voltage from the returned structure
+            voltage = _VOLTAGE_DATA.unpack_from(result_bytes)[0]
             
-            self.log.debug("voltage_read",
-                          message=f"Read line voltage: {voltage}V",
-                          voltage=voltage,
-                          channel=self.config.channel)
+            if self._debug_enabled:
+                self.log.debug("voltage_read",
+                              message=f"Read line voltage: {voltage}V",
+                              voltage=voltage,
+                              channel=self.config.channel)
             
             return voltage
             
@@ -399,7 +483,6 @@ class FXSPort:
             raise FXSError("Failed to read line voltage") from e
 
 
-    @log_function_call(level="DEBUG")
     async def play_audio(self, audio_data: bytes) -> None:
         """
         Play audio through FXS port.
@@ -414,10 +497,11 @@ class FXSPort:
             # Write to hardware
             await self.dahdi.write_audio(processed_audio.tobytes())
             
-            self.log.debug("audio_played",
-                          message="Audio data played",
-                          bytes_played=len(audio_data),
-                          audio_stats=stats)
+            if self._debug_enabled:
+                self.log.debug("audio_played",
+                              message="Audio data played",
+                              bytes_played=len(audio_data),
+                              audio_stats=stats)
             
         except (AudioProcessingError, DAHDIIOError) as e:
             self.log.error("audio_play_failed",
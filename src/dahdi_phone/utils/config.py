@@ -6,26 +6,70 @@ Provides type-safe access to configuration values with comprehensive error check
 """
 
 import os
+import copy
 import yaml
 import logging
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 from pathlib import Path
 
+# Prefer libyaml's C parser; same safe-load semantics as the pure Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Parsed YAML documents by path, with the (mtime in ns, size) they were read
+# at, so unchanged files are not re-read or re-parsed on loads and reloads
+_YAML_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+def _load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """
+    Parse a YAML file, reusing the previous result while the file is unchanged.
+    
+    Args:
+        path: Path to YAML file
+        
+    Returns:
+        Parsed document (empty dict for an empty file); a private copy the
+        caller may modify
+    """
+    st = path.stat()
+    key = str(path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        logger.debug(f"Using cached parse of {path}")
+        data = cached[2]
+    else:
+        with open(path) as f:
+            data = yaml.load(f.read(), Loader=_SafeLoader) or {}
+        _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
+@dataclass(frozen=True, eq=False)
 class ServerConfig:
     """Server configuration parameters"""
+    __slots__ = ('host', 'rest_port', 'websocket_port', 'workers')
     host: str
     rest_port: int
     websocket_port: int
     workers: int
 
-@dataclass
+    # Raw config keys as (field, type, default); a default of None marks a required key
+    _SCHEMA = (
+        ("host", str, "0.0.0.0"),
+        ("rest_port", int, 8000),
+        ("websocket_port", int, 8001),
+        ("workers", int, 4),
+    )
+
+@dataclass(frozen=True, eq=False)
 class DAHDIConfig:
     """DAHDI hardware configuration parameters"""
+    __slots__ = ('device', 'control', 'channel', 'sample_rate', 'channels', 'bit_depth', 'buffer_size')
     device: str
     control: str
     channel: int
@@ -34,39 +78,135 @@ class DAHDIConfig:
     bit_depth: int
     buffer_size: int
 
-@dataclass
+    # Keys of the dahdi section, and of its audio subsection
+    _SCHEMA = (
+        ("device", str, None),
+        ("control", str, None),
+        ("channel", int, None),
+        ("buffer_size", int, 320),
+    )
+    _AUDIO_SCHEMA = (
+        ("sample_rate", int, 8000),
+        ("channels", int, 1),
+        ("bit_depth", int, 16),
+    )
+
+@dataclass(frozen=True, eq=False)
 class LogConfig:
     """Logging configuration parameters"""
+    __slots__ = ('level', 'format', 'output', 'rotation', 'retention')
     level: str
     format: str
     output: str
     rotation: str
     retention: str
 
-@dataclass
+    _SCHEMA = (
+        ("level", str, "INFO"),
+        ("format", str, "json"),
+        ("output", str, None),
+        ("rotation", str, "1 day"),
+        ("retention", str, "30 days"),
+    )
+
+@dataclass(frozen=True, eq=False)
 class APIConfig:
     """API behavior configuration parameters"""
+    __slots__ = ('rate_limit', 'timeout', 'max_connections')
     rate_limit: int
     timeout: int
     max_connections: int
 
-@dataclass
+    _SCHEMA = (
+        ("rate_limit", int, 100),
+        ("timeout", int, 30),
+        ("max_connections", int, 1000),
+    )
+
+@dataclass(frozen=True, eq=False)
 class WebSocketConfig:
     """WebSocket configuration parameters"""
+    __slots__ = ('ping_interval', 'ping_timeout', 'max_message_size')
     ping_interval: int
     ping_timeout: int
     max_message_size: int
 
-@dataclass
+    _SCHEMA = (
+        ("ping_interval", int, 30),
+        ("ping_timeout", int, 10),
+        ("max_message_size", int, 1048576),
+    )
+
+@dataclass(frozen=True, eq=False)
 class SecurityConfig:
     """Security configuration parameters"""
+    __slots__ = ('allowed_origins', 'api_tokens')
     allowed_origins: list[str]
     api_tokens: list[str]
 
+    _SCHEMA = (
+        ("allowed_origins", list, ["*"]),
+        ("api_tokens", list, []),
+    )
+
+# Environment variable overrides as (variable, section, key, type conversion)
+_ENV_OVERRIDES: Tuple[Tuple[str, str, str, Optional[Callable[[str], Any]]], ...] = (
+    ("DAHDI_API_HOST", "server", "host", None),
+    ("DAHDI_API_REST_PORT", "server", "rest_port", int),
+    ("DAHDI_API_WS_PORT", "server", "websocket_port", int),
+    ("DAHDI_DEVICE", "dahdi", "device", None),
+    ("DAHDI_CHANNEL", "dahdi", "channel", int),
+    ("LOG_LEVEL", "logging", "level", None),
+    ("LOG_OUTPUT", "logging", "output", None),
+    ("API_TIMEOUT", "api", "timeout", int),
+    ("API_RATE_LIMIT", "api", "rate_limit", int),
+)
+
 class ConfigurationError(Exception):
     """Custom exception for configuration errors"""
     pass
 
+def _section_values(section: str, values: Dict[str, Any],
+                    schema: Tuple[Tuple[str, type, Any], ...]) -> Dict[str, Any]:
+    """
+    Read and type-check one configuration section against its schema.
+    
+    Args:
+        section: Configuration section name, for messages
+        values: Raw section dictionary
+        schema: (key, expected type, default) entries; a default of None
+            marks the key as required
+        
+    Returns:
+        Typed values by key
+        
+    Raises:
+        ConfigurationError: If a required value is missing or has an invalid type
+    """
+    result = {}
+    for key, value_type, default in schema:
+        value = values.get(key)
+
+        if value is None:
+            if default is None:
+                raise ConfigurationError(f"Required configuration missing: {section}.{key}")
+            # Defaults are copied so mutable ones are not shared between loads
+            value = copy.copy(default)
+            logger.debug("Using default value for %s.%s: %s", section, key, default)
+
+        try:
+            if value_type is list and isinstance(value, str):
+                value = [value]
+            elif not isinstance(value, value_type):
+                value = value_type(value)
+        except (ValueError, TypeError) as e:
+            raise ConfigurationError(
+                f"Invalid type for {section}.{key}: expected {value_type.__name__}, got {type(value).__name__}"
+            ) from e
+
+        result[key] = value
+    return result
+
 class Config:
     """
     Central configuration management for DAHDI Phone API.
@@ -81,17 +221,28 @@ class Config:
         return cls._instance
 
     def __init__(self):
-        if not self._initialized:
-            self.server = None
-            self.dahdi = None
-            self.logging = None
-            self.api = None
-            self.websocket = None
-            self.security = None
-            self._config_path = None
-            self._raw_config = {}
-            self._initialized = True
-            logger.debug("Configuration manager initialized")
+        if self._initialized:
+            return
+        self.server = None
+        self.dahdi = None
+        self.logging = None
+        self.api = None
+        self.websocket = None
+        self.security = None
+        self._config_path = None
+        self._raw_config = {}
+        # (path, mtime in ns, size, override environment) of the last applied load
+        self._last_load_key = None
+        self._initialized = True
+        logger.debug("Configuration manager initialized")
+
+    @classmethod
+    def get(cls) -> "Config":
+        """Return the configuration singleton, creating it on first use"""
+        instance = cls._instance
+        if instance is None or not instance._initialized:
+            instance = cls()
+        return instance
 
     def load(self, config_path: Union[str, Path]) -> None:
         """
@@ -110,9 +261,18 @@ class Config:
             if not self._config_path.exists():
                 raise ConfigurationError(f"Configuration file not found: {config_path}")
 
+            # Re-applying the file and overrides that produced the current
+            # configuration would not change it, so skip the whole load
+            st = self._config_path.stat()
+            load_key = (str(self._config_path), st.st_mtime_ns, st.st_size,
+                        tuple(os.environ.get(env_var) for env_var, _, _, _ in _ENV_OVERRIDES))
+            if load_key == self._last_load_key:
+                logger.debug(f"Configuration unchanged since last load of {self._config_path}")
+                return
+            self._last_load_key = None
+
             # Load the specified configuration file
-            with open(self._config_path) as f:
-                config_data = yaml.safe_load(f) or {}
+            config_data = _load_yaml_cached(self._config_path)
                 
             # If this is default.yml, set it as base config
             if self._config_path.name == "default.yml":
@@ -130,15 +290,16 @@ class Config:
             
             # Validate and create configuration objects
             self._validate_and_create_configs()
+            self._last_load_key = load_key
             
             logger.info(f"Configuration loaded successfully from {self._config_path}")
             logger.debug("Final configuration after environment overrides and validation:")
-            logger.debug(f"Server config: {vars(self.server)}")
-            logger.debug(f"DAHDI config: {vars(self.dahdi)}")
-            logger.debug(f"Logging config: {vars(self.logging)}")
-            logger.debug(f"API config: {vars(self.api)}")
-            logger.debug(f"WebSocket config: {vars(self.websocket)}")
-            logger.debug(f"Security config: {vars(self.security)}")
+            logger.debug(f"Server config: {self.server}")
+            logger.debug(f"DAHDI config: {self.dahdi}")
+            logger.debug(f"Logging config: {self.logging}")
+            logger.debug(f"API config: {self.api}")
+            logger.debug(f"WebSocket config: {self.websocket}")
+            logger.debug(f"Security config: {self.security}")
             
         except Exception as e:
             logger.error(f"Failed to load configuration: {str(e)}", exc_info=True)
@@ -146,90 +307,56 @@ class Config:
 
     def _apply_env_overrides(self) -> None:
         """Apply environment variable overrides to configuration"""
-        env_mapping = {
-            "DAHDI_API_HOST": ("server", "host"),
-            "DAHDI_API_REST_PORT": ("server", "rest_port", int),
-            "DAHDI_API_WS_PORT": ("server", "websocket_port", int),
-            "DAHDI_DEVICE": ("dahdi", "device"),
-            "DAHDI_CHANNEL": ("dahdi", "channel", int),
-            "LOG_LEVEL": ("logging", "level"),
-            "LOG_OUTPUT": ("logging", "output"),
-            "API_TIMEOUT": ("api", "timeout", int),
-            "API_RATE_LIMIT": ("api", "rate_limit", int),
-        }
-
-        for env_var, config_path in env_mapping.items():
-            if env_var in os.environ:
-                section, key = config_path[0], config_path[1]
-                value = os.environ[env_var]
-                
-                # Apply type conversion if specified
-                if len(config_path) > 2:
-                    try:
-                        value = config_path[2](value)
-                    except ValueError as e:
-                        raise ConfigurationError(
-                            f"Invalid environment variable {env_var}: {str(e)}"
-                        )
-
-                # Ensure section exists
-                if section not in self._raw_config:
-                    self._raw_config[section] = {}
-                    
-                self._raw_config[section][key] = value
-                logger.debug(f"Applied environment override: {env_var}={value}")
+        environ = os.environ
+        for env_var, section, key, convert in _ENV_OVERRIDES:
+            value = environ.get(env_var)
+            if value is None:
+                continue
+            
+            # Apply type conversion if specified
+            if convert is not None:
+                try:
+                    value = convert(value)
+                except ValueError as e:
+                    raise ConfigurationError(
+                        f"Invalid environment variable {env_var}: {str(e)}"
+                    )
+
+            self._raw_config.setdefault(section, {})[key] = value
+            logger.debug(f"Applied environment override: {env_var}={value}")
 
     def _validate_and_create_configs(self) -> None:
         """Validate configuration and create typed configuration objects"""
         try:
+            raw = self._raw_config
+            
             # Server configuration
-            self.server = ServerConfig(
-                host=self._get_config_value("server", "host", str, "0.0.0.0"),
-                rest_port=self._get_config_value("server", "rest_port", int, 8000),
-                websocket_port=self._get_config_value("server", "websocket_port", int, 8001),
-                workers=self._get_config_value("server", "workers", int, 4)
-            )
+            self.server = ServerConfig(**_section_values("server", raw.get("server") or {},
+                                                         ServerConfig._SCHEMA))
 
-            # DAHDI configuration
-            audio_config = self._raw_config.get("dahdi", {}).get("audio", {})
+            # DAHDI configuration, with audio settings in their own subsection
+            dahdi_config = raw.get("dahdi") or {}
             self.dahdi = DAHDIConfig(
-                device=self._get_config_value("dahdi", "device", str),
-                control=self._get_config_value("dahdi", "control", str),
-                channel=self._get_config_value("dahdi", "channel", int),
-                sample_rate=self._get_config_value("audio", "sample_rate", int, 8000, audio_config),
-                channels=self._get_config_value("audio", "channels", int, 1, audio_config),
-                bit_depth=self._get_config_value("audio", "bit_depth", int, 16, audio_config),
-                buffer_size=self._get_config_value("dahdi", "buffer_size", int, 320)
+                **_section_values("dahdi", dahdi_config, DAHDIConfig._SCHEMA),
+                **_section_values("audio", dahdi_config.get("audio") or {},
+                                  DAHDIConfig._AUDIO_SCHEMA)
             )
 
             # Logging configuration
-            self.logging = LogConfig(
-                level=self._get_config_value("logging", "level", str, "INFO"),
-                format=self._get_config_value("logging", "format", str, "json"),
-                output=self._get_config_value("logging", "output", str),
-                rotation=self._get_config_value("logging", "rotation", str, "1 day"),
-                retention=self._get_config_value("logging", "retention", str, "30 days")
-            )
+            self.logging = LogConfig(**_section_values("logging", raw.get("logging") or {},
+                                                       LogConfig._SCHEMA))
 
             # API configuration
-            self.api = APIConfig(
-                rate_limit=self._get_config_value("api", "rate_limit", int, 100),
-                timeout=self._get_config_value("api", "timeout", int, 30),
-                max_connections=self._get_config_value("api", "max_connections", int, 1000)
-            )
+            self.api = APIConfig(**_section_values("api", raw.get("api") or {},
+                                                   APIConfig._SCHEMA))
 
             # WebSocket configuration
-            self.websocket = WebSocketConfig(
-                ping_interval=self._get_config_value("websocket", "ping_interval", int, 30),
-                ping_timeout=self._get_config_value("websocket", "ping_timeout", int, 10),
-                max_message_size=self._get_config_value("websocket", "max_message_size", int, 1048576)
-            )
+            self.websocket = WebSocketConfig(**_section_values("websocket", raw.get("websocket") or {},
+                                                               WebSocketConfig._SCHEMA))
 
             # Security configuration
-            self.security = SecurityConfig(
-                allowed_origins=self._get_config_value("security", "allowed_origins", list, ["*"]),
-                api_tokens=self._get_config_value("security", "api_tokens", list, [])
-            )
+            self.security = SecurityConfig(**_section_values("security", raw.get("security") or {},
+                                                             SecurityConfig._SCHEMA))
 
             logger.debug("Configuration validation completed successfully")
 
@@ -237,62 +364,19 @@ class Config:
             logger.error("Configuration validation failed", exc_info=True)
             raise ConfigurationError(f"Configuration validation failed: {str(e)}") from e
 
-    def _get_config_value(
-        self,
-        section: str,
-        key: str,
-        value_type: type,
-        default: Any = None,
-        config_dict: Optional[Dict] = None
-    ) -> Any:
-        """
-        Get typed configuration value with validation.
-        
-        Args:
-            section: Configuration section name
-            key: Configuration key
-            value_type: Expected value type
-            default: Optional default value
-            config_dict: Optional alternative configuration dictionary
-            
-        Returns:
-            Typed configuration value
-            
-        Raises:
-            ConfigurationError: If value is missing or invalid type
-        """
-        config = config_dict if config_dict is not None else self._raw_config.get(section, {})
-        value = config.get(key)
-
-        if value is None:
-            if default is None:
-                raise ConfigurationError(f"Required configuration missing: {section}.{key}")
-            value = default
-            logger.debug(f"Using default value for {section}.{key}: {default}")
-
-        try:
-            if value_type == list and isinstance(value, str):
-                value = [value]
-            elif not isinstance(value, value_type):
-                value = value_type(value)
-        except (ValueError, TypeError) as e:
-            raise ConfigurationError(
-                f"Invalid type for {section}.{key}: expected {value_type.__name__}, got {type(value).__name__}"
-            ) from e
-
-        return value
-
     def _merge_configs(self, custom_config: Dict[str, Any]) -> None:
         """Deep merge custom configuration with existing config"""
-        def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> None:
+        # Iterative, with an explicit stack of (base, override) dict pairs
+        stack = [(self._raw_config, custom_config)]
+        while stack:
+            base, override = stack.pop()
             for key, value in override.items():
-                if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                    deep_merge(base[key], value)
+                current = base.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
                 else:
                     base[key] = value
 
-        deep_merge(self._raw_config, custom_config)
-
     def reload(self) -> None:
         """Reload configuration from file"""
         logger.info("Reloading configuration")
@@ -304,7 +388,7 @@ class Config:
 # Example usage:
 """
 # Get configuration instance
-config = Config()
+config = Config.get()
 
 # Load configuration
 config.load("/etc/dahdi_phone/config.yml")
@@ -211,10 +211,16 @@ def log_function_call(level: str = "DEBUG") -> Callable:
         Decorator function
     """
     def decorator(func: Callable) -> Callable:
+        log_level = getattr(logging, level.upper())
+        std_logger = logging.getLogger(func.__module__)
+        
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Skip argument/result formatting entirely when the level is disabled
+            if not std_logger.isEnabledFor(log_level):
+                return func(*args, **kwargs)
+            
             logger = DAHDILogger().get_logger(func.__module__)
-            log_level = getattr(logging, level.upper())
             
             # Log function entry
             logger.log(log_level, 
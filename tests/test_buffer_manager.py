@@ -0,0 +1,55 @@
+# tests/test_buffer_manager.py
+"""
+Tests for the mirrored CircularBuffer mapping lifetime.
+"""
+
+import gc
+
+import pytest
+
+from dahdi_phone.core.buffer_manager import BufferError, CircularBuffer
+
+
+def _mirrored_buffer() -> CircularBuffer:
+    buf = CircularBuffer(4096)
+    if not buf.mirrored:
+        buf.close()
+        pytest.skip("mirrored mapping not supported on this platform")
+    return buf
+
+
+def test_peek_view_outlives_buffer():
+    buf = _mirrored_buffer()
+    assert buf.write(b"abcd")
+    view = buf.peek(4)
+    del buf
+    gc.collect()
+    assert bytes(view) == b"abcd"
+
+
+def test_close_refuses_while_view_exported():
+    buf = _mirrored_buffer()
+    assert buf.write(b"abcd")
+    view = buf.peek(4)
+    with pytest.raises(BufferError):
+        buf.close()
+    gc.collect()
+    assert bytes(view) == b"abcd"
+    view.release()
+
+
+def test_close_unmaps_without_views():
+    buf = _mirrored_buffer()
+    assert buf.write(b"abcd")
+    assert buf.read(4) == b"abcd"
+    buf.close()
+    buf.close()
+
+
+def test_write_accepts_buffer_types():
+    buf = CircularBuffer(4096)
+    assert buf.write(memoryview(b"ab"))
+    assert buf.write(bytearray(b"cd"))
+    assert buf.write(b"ef")
+    assert buf.read(6) == b"abcdef"
+    buf.close()
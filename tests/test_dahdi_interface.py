@@ -0,0 +1,62 @@
+# tests/test_dahdi_interface.py
+"""
+Tests for DAHDIInterface event publishing.
+"""
+
+import asyncio
+
+import orjson
+
+from dahdi_phone.core import dahdi_interface
+from dahdi_phone.core.dahdi_interface import DAHDIEvent, DAHDIInterface, DAHDIState
+
+
+def _publish_hook_events(monkeypatch, codes):
+    """Feed DAHDI event codes through the event handler and collect the wire payloads"""
+    async def run():
+        iface = DAHDIInterface("/dev/null")
+        iface.state = DAHDIState.ONHOOK
+        stream = await iface.open_event_stream()
+        payloads = []
+        for code in codes:
+            monkeypatch.setattr(dahdi_interface.fcntl, "ioctl",
+                                lambda fd, cmd, arg, code=code: dahdi_interface._I32.pack(code))
+            iface._handle_dahdi_event()
+            await iface._notify_websocket_subscribers(await iface.get_next_event())
+            payloads.append(orjson.loads(await stream.get()))
+        return payloads
+    return asyncio.run(run())
+
+
+def test_hook_events_use_phone_event_types(monkeypatch):
+    off_hook, on_hook = _publish_hook_events(
+        monkeypatch, (DAHDIEvent.RINGOFFHOOK, DAHDIEvent.ONHOOK))
+    assert off_hook["type"] == "off_hook"
+    assert on_hook["type"] == "on_hook"
+    assert set(off_hook) == {"type", "timestamp"}
+
+
+def test_event_timestamps_are_utc(monkeypatch):
+    (off_hook,) = _publish_hook_events(monkeypatch, (DAHDIEvent.RINGOFFHOOK,))
+    assert off_hook["timestamp"].endswith("Z")
+
+
+class _FailingStopPort:
+    """FXS port whose ring starts but cannot return the line to idle voltage"""
+    def set_ring_signal(self, active):
+        if not active:
+            raise OSError("idle voltage ioctl failed")
+
+
+def test_failed_ring_stop_sets_error_state():
+    async def run():
+        iface = DAHDIInterface("/dev/null")
+        iface.state = DAHDIState.ONHOOK
+        iface.fxs_port = _FailingStopPort()
+        await iface.ring(10)
+        assert iface.state == DAHDIState.RINGING
+        await asyncio.sleep(0.05)
+        return iface
+    iface = asyncio.run(run())
+    assert iface.state == DAHDIState.ERROR
+    assert iface._ring_handle is None